@@ -0,0 +1,369 @@
+r"""
+Synthetic PDFs mimicking the first pages of the supported journals.
+
+Each entry of CORPUS maps a parser key (see pdf_rename.journals.parsers)
+to the pages of a small PDF and its document information, laid out so
+that the file is handled by that parser. The PDFs are built from scratch,
+without network access or third-party tools:
+
+    python benchmarks/corpus.py DIRECTORY [--xmp]
+
+Parsers that cannot be reached have no entry; they are listed by
+unreachable(), and printed when the corpus is built. Most of them cannot
+be reached because no pattern in journals matches their journal. Others
+have a signature that never matches a line their parser can read:
+typology_old's signature 'Linguistic Typology \d{1,2};' does not match the
+'Linguistic Typology 12 (2008), 1–30' that parse_typology_old expects.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+
+from pdf_rename.journals import registry  # noqa: E402
+
+# Each page is a list of blocks of lines; blocks are set apart far enough
+# to be laid out as separate text boxes, i.e. separated by empty lines.
+CORPUS = {
+    'jstor': ([[
+        ['A Paper on Something', 'Author(s): Noam Chomsky',
+         'Source: Linguistic Inquiry, Vol. 8, No. 3 (Summer, 1977), '
+         'pp. 425-504',
+         'Published by: The MIT Press',
+         'Stable URL: http://www.jstor.org/stable/4178000'],
+        ]], {'Producer': 'JSTOR'}),
+    'bbs': ([[
+        ['BEHAVIORAL AND BRAIN SCIENCES (2019) 42, 1 –60',
+         'doi:10.1017/S0140525X18000001'],
+        ['The title of a target article'],
+        ['Jane Doe'],
+        ['John Smith'],
+        ['Abstract: The abstract of the target article.'],
+        ]], {}),
+    'cjl': ([[
+        ['Canadian Journal of Linguistics/Revue canadienne de '
+         'linguistique, 64(1): 1–30, 2019',
+         'doi:10.1017/cnj.2019.1'],
+        ['The title of a CJL paper'],
+        ['JANE DOE', 'University of Toronto'],
+        ]], {}),
+    'cognitive_psychology': ([[
+        ['Cognitive Psychology 101 (2018) 1–20'],
+        ['Contents lists available at ScienceDirect'],
+        ['Cognitive Psychology'],
+        ['journal homepage: www.elsevier.com/locate/cogpsych'],
+        ['The title of the paper'],
+        ['Jane Doe, John Smith'],
+        ['Abstract', 'https://doi.org/10.1016/j.cogpsych.2018.01.001'],
+        ]], {}),
+    'jcgl': ([[
+        ['Journal of Comparative Germanic Linguistics 22: 1–30, 2019',
+         'https://doi.org/10.1007/s10828-019-09101-1'],
+        ['The title of a JCGL paper'],
+        ['Jane Doe and John Smith'],
+        ]], {'Title': 'The title of a JCGL paper',
+             'Author': 'Jane Doe and John Smith'}),
+    'frontiers': ([[
+        ['ORIGINAL RESEARCH', 'published: 10 January 2019',
+         'doi: 10.3389/fpsyg.2019.01234'],
+        ['The title of a Frontiers paper'],
+        ['Jane Doe1* and John Smith2'],
+        ['Citation:', 'Doe J and Smith J (2019) The title.',
+         'Front. Psychol. 10:1234.', 'doi: 10.3389/fpsyg.2019.01234'],
+        ['Frontiers in Psychology | www.frontiersin.org',
+         'January 2019 | Volume 10 | Article 1234'],
+        ]], {'Title': 'The title of a Frontiers paper'}),
+    'jol': ([[
+        ['J. Linguistics 55 (2019), 1–30. Cambridge University Press 2019',
+         'doi:10.1017/S0022226718000001'],
+        ['On relative clauses in', 'Germanic languages1', 'JANE DOE',
+         'University of Somewhere'],
+        ]], {}),
+    'jgl': ([[
+        ['Journal ofGermanic Linguistics 31.1 (2019):1-30'],
+        ['The title of a JGL paper'],
+        ['Jane Doe and John Smith'],
+        ]], {'Author': 'Jane Doe and John Smith'}),
+    'glossa': ([[
+        ['Glossa: a journal of general linguistics 4(1): 12. 2019. 1-30. '
+         'DOI: 10.5334/gjgl.123'],
+        ['The title of a Glossa paper'],
+        ]], {'Subject': 'Glossa: a journal of general linguistics, '
+                        'DOI: 10.5334/gjgl.123',
+             'Title': 'The title of a Glossa paper',
+             'Author': 'Jane Doe and John Smith'}),
+    'glossa_citation': ([[
+        ['The title of a newer Glossa paper'],
+        ['TO CITE THIS ARTICLE:',
+         'Doe, Jane and John Smith. 2021. The title of a newer Glossa ',
+         'paper. Glossa: a journal of general linguistics 6(1): 34. ',
+         '1–34. DOI: https://doi.org/10.5334/gjgl.1343'],
+        ]], {}),
+    'jlm': ([[
+        ['The title of a JLM paper'],
+        ['Jane Doe1 and John Smith2'],
+        ['Journal of Language Modelling Vol 7, No 1 (2019), pp. 1–30'],
+        ]], {}),
+    'jml': ([[
+        ['Journal of Memory and Language 100 (2018) 1–20'],
+        ['https://doi.org/10.1016/j.jml.2018.01.001'],
+        ]], {'Subject': 'Journal of Memory and Language, 100 (2018) 1-20. '
+                        'doi:10.1016/j.jml.2018.01.001',
+             'Title': 'The title of a JML paper',
+             'Author': 'Jane Doe, John Smith'}),
+    'lsp_book': ([
+        [['The title of a book'], ['Jane Doe'],
+         ['http://www.languagesciencepress.org']],
+        [['Studies in Syntax']],
+        [['Editors']],
+        [['Jane Doe. 2019. The title of a book (Studies in Syntax 5).',
+          'Berlin: Language Science Press.'],
+         ['This title can be downloaded at:'],
+         ['DOI: 10.5281/zenodo.1234567']],
+        ], {}),
+    'lsp_chapter': ([[
+        ['Chapter 3'],
+        ['The title of a chapter'],
+        ['Jane Doe', 'University of Somewhere'],
+        ['Abstract. The abstract of the chapter.'],
+        ['Jane Doe. 2019. The title of a chapter. In John Smith & Ann Lee '
+         '(eds.), ',
+         'The title of a book, 1–30. Berlin: Language Science Press. ',
+         'DOI: 10.5281/zenodo.1234568'],
+        ]], {}),
+    'language': ([[
+        ['Language, Volume 95, Number 1, March 2019, pp. 1-30 (Article)',
+         'Published by Linguistic Society of America',
+         'DOI: https://doi.org/10.1353/lan.2019.0001'],
+        ]], {'Title': 'The title of a Language paper',
+             'Author': 'Jane Doe, John Smith'}),
+    'language_sciences': ([[
+        ['Language & Communication 60 (2018) 1–20, '
+         '10.1016/j.langcom.2018.01.001'],
+        ]], {'Title': 'The title of a paper',
+             'Author': 'Jane Doe, John Smith'}),
+    'lingua': ([[
+        ['Lingua 200 (2017) 1-20'],
+        ['doi.org/10.1016/j.lingua.2017.01.001'],
+        ]], {'Subject': 'Lingua, 200 (2017) 1-20. '
+                        'doi:10.1016/j.lingua.2017.01.001',
+             'Title': 'On lingua things: a study',
+             'Author': 'Mary Major, Ann Minor'}),
+    'li': ([[
+        ['On Relative Clauses'],
+        ['Jane Doe', 'John Smith'],
+        ['The text of the article begins here.'],
+        ['Linguistic Inquiry, Volume 50, Number 1, Winter 2019', '1–30',
+         '2019 by the Massachusetts Institute of Technology',
+         'https://doi.org/10.1162/ling_a_00001'],
+        ]], {}),
+    'typology': ([[
+        ['Linguistic Typology 2019; 23(1): 1–30'],
+        ['Jane Doe* and John Smith', 'The title of a typology paper'],
+        ['https://doi.org/10.1515/lingty-2019-0001'],
+        ]], {}),
+    'linguistics': ([[
+        ['Linguistics 2019; 57(1): 1–30'],
+        ['Jane Doe*, John Smith and Ann Lee',
+         'The title of a Linguistics paper'],
+        ['https://doi.org/10.1515/ling-2019-0001'],
+        ]], {}),
+    'vanguard': ([[
+        ['Linguistics Vanguard 2019; 5(1): 20180001'],
+        ['Jane Doe* and John Smith', 'The title of a Vanguard paper'],
+        ['https://doi.org/10.1515/lingvan-2018-0001'],
+        ]], {}),
+    'morphology': ([[
+        ['Morphology (2019) 29:1–30',
+         'https://doi.org/10.1007/s11525-019-09331-1'],
+        ['ORIGINAL PAPER'],
+        ['Jane Doe and John Smith'],
+        ['The title of a Morphology paper'],
+        ]], {}),
+    'nllt': ([[
+        ['Nat Lang Linguist Theory (2019) 37:1^30',
+         'https://doi.org/10.1007/s11049-018-9999-1'],
+        ['Title of NLLT paper'],
+        ['Peter Parker1 · Mary Jane2'],
+        ['Received: 1 January 2018 / Accepted: 2 February 2018'],
+        ]], {'Subject': 'Nat Lang Ling Theory, '
+                        'https://doi.org/10.1007/s11049-018-9999-1'}),
+    'nls': ([[
+        ['Nat Lang Semantics (2019) 27:1–30',
+         'https://doi.org/10.1007/s11050-019-09151-1'],
+        ['The title of an NLS paper'],
+        ['Jane Doe1 · John Smith2'],
+        ['Received: 1 January 2018 / Accepted: 2 February 2018'],
+        ]], {}),
+    'pnas': ([[
+        ['The title of a PNAS paper'],
+        ['Jane Doe1,2 and John Smith3'],
+        ['Edited by Ann Lee, University of Somewhere'],
+        ['PNAS 2019 Vol. 116 No. 3 e1234567116',
+         'https://doi.org/10.1073/pnas.1234567116', '1 of 10'],
+        ]], {'Title': 'The title of a PNAS paper'}),
+    'tlr': ([[
+        ['The Linguistic Review 2019; 36(1): 1–30'],
+        ['Jane Doe* and John Smith', 'The title of a TLR paper'],
+        ['https://doi.org/10.1515/tlr-2018-2001'],
+        ]], {}),
+    'theoretical_linguistics': ([[
+        ['Theoretical Linguistics 2019; 45(1–2): 1–30'],
+        ['Jane Doe*', 'The title of a TL paper'],
+        ['https://doi.org/10.1515/tl-2019-0001'],
+        ]], {}),
+    'zs': ([[
+        ['The title of a ZS paper'],
+        ['Jane Doe* and John Smith'],
+        ['Zeitschrift für Sprachwissenschaft 28 (2009), 1(cid:2)30',
+         'DOI 10.1515/ZFSW.2009.001'],
+        ]], {}),
+    }
+
+# XMP metadata as written by the publishers of some of the journals, for
+# building the corpus with --xmp (see pdf_rename.journals.xmp_journals).
+XMP = {
+    'lingua': {'dc:title': 'On lingua things: a study',
+               'dc:creator': ['Mary Major', 'Ann Minor'],
+               'prism:publicationName': 'Lingua',
+               'prism:coverDate': '2017-12-01', 'prism:volume': '200',
+               'prism:startingPage': '1', 'prism:endingPage': '20',
+               'prism:doi': '10.1016/j.lingua.2017.01.001'},
+    'nllt': {'dc:title': 'Title of NLLT paper',
+             'dc:creator': ['Peter Parker', 'Mary Jane'],
+             'prism:publicationName': 'Natural Language & Linguistic Theory',
+             'prism:publicationDate': '2019-02-01', 'prism:volume': '37',
+             'prism:number': '1', 'prism:startingPage': '1',
+             'prism:endingPage': '30',
+             'prism:doi': '10.1007/s11049-018-9999-1'},
+    'linguistics': {'dc:title': 'The title of a Linguistics paper',
+                    'dc:creator': ['Jane Doe', 'John Smith', 'Ann Lee'],
+                    'prism:publicationName': 'Linguistics',
+                    'prism:coverDate': '2019-01-01', 'prism:volume': '57',
+                    'prism:number': '1', 'prism:startingPage': '1',
+                    'prism:endingPage': '30',
+                    'prism:doi': '10.1515/ling-2019-0001'},
+    }
+
+
+def xmp_packet(properties):
+    """Return an XMP packet with the dc and prism properties."""
+    def escape(text):
+        return text.replace('&', '&amp;').replace('<', '&lt;')
+
+    elements = []
+    for name, value in properties.items():
+        if name == 'dc:title':
+            value = ('<rdf:Alt><rdf:li xml:lang="x-default">' +
+                     escape(value) + '</rdf:li></rdf:Alt>')
+        elif name == 'dc:creator':
+            value = '<rdf:Seq>' + ''.join('<rdf:li>' + escape(creator) +
+                                          '</rdf:li>' for creator in value) \
+                + '</rdf:Seq>'
+        else:
+            value = escape(value)
+        elements.append('<%s>%s</%s>' % (name, value, name))
+    return ('<?xpacket begin="\ufeff" id="W5M0MpCehiHzreSzNTczkc9d"?>\n'
+            '<x:xmpmeta xmlns:x="adobe:ns:meta/">'
+            '<rdf:RDF xmlns:rdf='
+            '"http://www.w3.org/1999/02/22-rdf-syntax-ns#">'
+            '<rdf:Description rdf:about="" '
+            'xmlns:dc="http://purl.org/dc/elements/1.1/" '
+            'xmlns:prism="http://prismstandard.org/namespaces/basic/2.0/">' +
+            ''.join(elements) +
+            '</rdf:Description></rdf:RDF></x:xmpmeta>\n'
+            '<?xpacket end="w"?>').encode('utf-8')
+
+
+def pdf_string(string):
+    return '(' + string.replace('\\', '\\\\').replace('(', '\\(') \
+        .replace(')', '\\)') + ')'
+
+
+def page_content(blocks):
+    """Return the content stream setting the blocks of lines on a page."""
+    ops = ['BT', '/F1 10 Tf']
+    y = 760
+    for block in blocks:
+        for line in block:
+            ops.append('1 0 0 1 72 %d Tm %s Tj' % (y, pdf_string(line)))
+            y = y - 12
+        y = y - 30
+    ops.append('ET')
+    return '\n'.join(ops).encode('cp1252', 'replace')
+
+
+def make_pdf(filename, pages, info, xmp=None):
+    """
+    Write a PDF with the given pages and document information, and the
+    XMP metadata xmp (see xmp_packet) if given.
+    """
+    catalog = b'<< /Type /Catalog /Pages 2 0 R >>'
+    objects = [catalog, None,
+               b'<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica '
+               b'/Encoding /WinAnsiEncoding >>']
+    kids = []
+    for blocks in pages:
+        content = page_content(blocks)
+        objects.append(b'<< /Length %d >>\nstream\n' % len(content) +
+                       content + b'\nendstream')
+        objects.append(b'<< /Type /Page /Parent 2 0 R '
+                       b'/MediaBox [0 0 612 792] '
+                       b'/Resources << /Font << /F1 3 0 R >> >> '
+                       b'/Contents %d 0 R >>' % (len(objects)))
+        kids.append(b'%d 0 R' % len(objects))
+    objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % \
+        (b' '.join(kids), len(kids))
+    if xmp:
+        packet = xmp_packet(xmp)
+        objects.append(b'<< /Type /Metadata /Subtype /XML /Length %d >>\n'
+                       b'stream\n' % len(packet) + packet + b'\nendstream')
+        objects[0] = catalog[:-2] + b'/Metadata %d 0 R >>' % len(objects)
+    objects.append(('<< ' + ' '.join('/' + key + ' ' + pdf_string(value)
+                                     for key, value in info.items()) +
+                    ' >>').encode('cp1252'))
+    data = bytearray(b'%PDF-1.4\n')
+    offsets = []
+    for number, obj in enumerate(objects, 1):
+        offsets.append(len(data))
+        data += b'%d 0 obj\n' % number + obj + b'\nendobj\n'
+    xref = len(data)
+    data += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+    for offset in offsets:
+        data += b'%010d 00000 n \n' % offset
+    data += b'trailer\n<< /Size %d /Root 1 0 R /Info %d 0 R >>\n' % \
+        (len(objects) + 1, len(objects))
+    data += b'startxref\n%d\n%%%%EOF\n' % xref
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+def unreachable():
+    """Return the keys of the registered parsers without a PDF in CORPUS."""
+    return [key for key, pattern, target in registry.parsers
+            if key not in CORPUS]
+
+
+def build(directory, keys=None, xmp=False):
+    """
+    Write the PDFs of the corpus (or those for keys) to directory, with
+    XMP metadata for the journals in XMP if xmp is true.
+
+    Returns a dictionary mapping the parser keys to the filenames.
+    """
+    os.makedirs(directory, exist_ok=True)
+    filenames = {}
+    for key in keys or CORPUS:
+        pages, info = CORPUS[key]
+        filenames[key] = os.path.join(directory, key + '.pdf')
+        make_pdf(filenames[key], pages, info,
+                 XMP.get(key) if xmp else None)
+    return filenames
+
+
+if __name__ == '__main__':
+    for key, filename in build(sys.argv[1],
+                               xmp='--xmp' in sys.argv[2:]).items():
+        print(filename)
+    print('No PDFs for: ' + ', '.join(unreachable()), file=sys.stderr)
@@ -0,0 +1,70 @@
+"""
+Benchmark journal detection against the number of known journals.
+
+Compares the sequential scan (every pattern in `journals` searched on
+every first-page line, as pdf-rename.py used to do) with the compiled
+`journal_re` and `find_parser` of pdf_rename.journals.registry. Synthetic
+journals are added to the table to show how both scale.
+
+    python benchmarks/detection.py [--lines N] [--repeat N]
+"""
+import argparse
+import os
+import re
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+
+from pdf_rename import journals as script  # noqa: E402
+
+
+def page(n_lines):
+    """A first page whose journal line is at the bottom (worst case)."""
+    lines = ['Some line %d of an abstract about relative clauses' % i
+             for i in range(n_lines - 1)]
+    return lines + ['Nat Lang Linguist Theory (2019) 37:1–30']
+
+
+def sequential(journals, lines):
+    return [line for line in lines
+            if any(re.search(journal, line) for journal in journals)][0]
+
+
+def compiled(journal_re, lines):
+    return [line for line in lines if journal_re.search(line)][0]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--lines', type=int, default=200)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    lines = page(args.lines)
+    print('%8s %14s %14s %8s' % ('journals', 'sequential ms', 'compiled ms',
+                                 'speedup'))
+    for extra in (0, 100, 200, 400):
+        journals = script.journals + ['Journal of Synthetic Studies %d' % i
+                                      for i in range(extra)]
+        journal_re = re.compile('|'.join('(?:' + journal + ')'
+                                         for journal in journals))
+        assert sequential(journals, lines) == compiled(journal_re, lines)
+        old = min(timeit.repeat(lambda: sequential(journals, lines),
+                                number=1, repeat=args.repeat))
+        new = min(timeit.repeat(lambda: compiled(journal_re, lines),
+                                number=1, repeat=args.repeat))
+        print('%8d %14.2f %14.2f %7.1fx' % (len(journals), old * 1000,
+                                            new * 1000, old / new))
+
+    subjects = [lines[-1]] * 1000
+    dispatch = min(timeit.repeat(
+        lambda: [script.find_parser(subject) for subject in subjects],
+        number=1, repeat=args.repeat))
+    print('find_parser: %.1f µs per subject (%d parsers)'
+          % (dispatch * 1e6 / len(subjects), len(script.parsers)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark parsing per journal on the synthetic corpus (see corpus.py).
+
+The PDF for each parser is parsed --repeat times in a fresh process. For
+each journal the median latency, the files parsed per second and the peak
+resident memory of the process (and how much of it parsing added to the
+imported modules) are reported.
+
+    python benchmarks/parsers.py [--repeat N] [--journal KEY ...] [--xmp]
+
+With --xmp, the PDFs of the journals whose publishers write XMP metadata
+have it, so that they are parsed without laying out the page.
+"""
+import argparse
+import concurrent.futures
+import multiprocessing
+import os
+import resource
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+
+from corpus import CORPUS, build, unreachable  # noqa: E402
+from pdf_rename.parse import parse_pdf  # noqa: E402
+from pdf_rename.text import HEAD_FRACTION  # noqa: E402
+
+# ru_maxrss is in kilobytes, except on macOS.
+RSS_UNIT = 1 if sys.platform == 'darwin' else 1024
+
+
+def peak_rss():
+    """Return the peak resident memory of this process in MB."""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * RSS_UNIT \
+        / (1 << 20)
+
+
+def run(filename, repeat, head_fraction):
+    """
+    Parse filename repeat times.
+
+    Returns the latencies, and the peak resident memory before and after.
+    """
+    before = peak_rss()
+    times = []
+    for i in range(repeat):
+        start = time.perf_counter()
+        parse_pdf(filename, head_fraction)
+        times.append(time.perf_counter() - start)
+    return times, before, peak_rss()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n')[1])
+    parser.add_argument('--repeat', type=int, default=20)
+    parser.add_argument('--journal', metavar='KEY', action='append',
+                        choices=sorted(CORPUS),
+                        help='only benchmark this journal (default: all)')
+    parser.add_argument('--head-fraction', type=float, default=HEAD_FRACTION)
+    parser.add_argument('--xmp', action='store_true',
+                        help='add XMP metadata where publishers write it')
+    args = parser.parse_args()
+
+    context = multiprocessing.get_context('spawn')
+    print('%-24s %10s %10s %10s %10s' % ('journal', 'median ms', 'files/s',
+                                         'peak MB', 'parse MB'))
+    with tempfile.TemporaryDirectory() as directory:
+        filenames = build(directory, args.journal, args.xmp)
+        total_files, total_time = 0, 0
+        for key, filename in filenames.items():
+            # A fresh process each, so that the peak memory is per journal.
+            with concurrent.futures.ProcessPoolExecutor(
+                    1, mp_context=context) as executor:
+                try:
+                    times, before, after = executor.submit(
+                        run, filename, args.repeat,
+                        args.head_fraction).result()
+                except Exception as error:
+                    print('%-24s failed: %s' % (key, error))
+                    continue
+            total_files = total_files + len(times)
+            total_time = total_time + sum(times)
+            print('%-24s %10.2f %10.1f %10.1f %10.1f'
+                  % (key, statistics.median(times) * 1000,
+                     len(times) / sum(times), after, after - before))
+    if total_time:
+        print('%-24s %10s %10.1f' % ('all', '', total_files / total_time))
+    print('No PDFs for: ' + ', '.join(unreachable()))
+
+
+if __name__ == '__main__':
+    main()
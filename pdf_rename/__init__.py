@@ -0,0 +1,14 @@
+"""
+Rename PDFs of linguistics papers to include author(s), year, and title.
+
+The library API consists of parse_pdf, which extracts a Record from a PDF,
+rename, which renames (or copies) the PDF after its record, and
+to_biblatex, which returns the biblatex entry for a record. Importing the
+package does not read any files; the command line interface is in cli.
+"""
+from .biblatex import to_biblatex
+from .files import rename
+from .parse import parse_pdf
+from .record import PDFRenameError, Record
+
+__all__ = ['PDFRenameError', 'Record', 'parse_pdf', 'rename', 'to_biblatex']
@@ -0,0 +1,131 @@
+"""Appending biblatex entries to a .bib file without duplicates."""
+import json
+import os
+import re
+import string
+
+from .biblatex import citekey, to_biblatex
+from .names import name_authors
+
+ENTRY_RE = re.compile(r'^@(\w+)\s*\{\s*([^,\s]+)\s*,', re.M)
+FIELD_RE = re.compile(r'^\s*(doi|title|year)\s*=\s*\{(.*)\},?\s*$',
+                      re.M | re.I)
+
+
+def entry_id(doi, title, year):
+    """
+    Return what identifies an entry: its DOI, or else its title and year.
+
+    Returns None if there is neither a DOI nor a title.
+    """
+    if doi:
+        return 'doi:' + doi.lower()
+    if title:
+        return 'title:' + ' '.join(title.lower().split()) + ':' + year
+    return None
+
+
+def scan(text):
+    """Return the citekeys and entry ids (see entry_id) in text."""
+    keys = set()
+    ids = set()
+    starts = [match.start() for match in ENTRY_RE.finditer(text)]
+    for start, end in zip(starts, starts[1:] + [len(text)]):
+        entry = text[start:end]
+        keys.add(ENTRY_RE.match(entry).group(2))
+        fields = {name.lower(): value
+                  for name, value in FIELD_RE.findall(entry)}
+        identity = entry_id(fields.get('doi'), fields.get('title'),
+                            fields.get('year', ''))
+        if identity:
+            ids.add(identity)
+    return keys, ids
+
+
+class BibFile:
+    """
+    A .bib file that new entries are appended to, skipping duplicates.
+
+    Entries are duplicates if they have the same DOI or, without a DOI,
+    the same title and year. Citekeys that are taken get a suffix (a, b,
+    ...). The citekeys and entry ids are kept in an index next to the
+    file (path + '.index'), which is rebuilt with a single scan of the file
+    whenever the file was changed by something else.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index_path = path + '.index'
+        self.added = 0
+        self.duplicates = 0
+        self.keys, self.ids = self.load_index()
+        self.file = open(path, 'a', encoding='utf-8')
+        if self.file.tell() > 0:
+            with open(path, 'rb') as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read() != b'\n':
+                    self.file.write('\n')
+
+    def load_index(self):
+        """Return the keys and ids of the file, from the index if valid."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return set(), set()
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                index = json.load(f)
+            if index['stat'] == [st.st_size, st.st_mtime_ns]:
+                return set(index['keys']), set(index['ids'])
+        except (OSError, ValueError, KeyError):
+            pass
+        with open(self.path, encoding='utf-8', errors='replace') as f:
+            return scan(f.read())
+
+    def unique_key(self, key):
+        """Return key, or key with the first free suffix if it is taken."""
+        if key not in self.keys:
+            return key
+        for suffix in string.ascii_lowercase:
+            if key + suffix not in self.keys:
+                return key + suffix
+        n = 27
+        while key + str(n) in self.keys:
+            n = n + 1
+        return key + str(n)
+
+    def add(self, record):
+        """
+        Append the entry for record unless it is a duplicate.
+
+        Returns the citekey of the new entry, or None for duplicates.
+        """
+        identity = entry_id(record.doi, record.title, record.year)
+        if identity in self.ids:
+            self.duplicates = self.duplicates + 1
+            return None
+        key = self.unique_key(citekey(name_authors(record.authors), record))
+        collection = False
+        if record.entry_type == 'incollection':
+            # Chapters of the same book share the entry of the collection.
+            collection_key = citekey(name_authors(record.editors), record)
+            collection = collection_key not in self.keys
+            self.keys.add(collection_key)
+        self.file.write(to_biblatex(record, key, collection).rstrip('\n') +
+                        '\n\n')
+        self.file.flush()
+        self.keys.add(key)
+        if identity:
+            self.ids.add(identity)
+        self.added = self.added + 1
+        return key
+
+    def close(self):
+        """Close the file and save the index."""
+        self.file.close()
+        st = os.stat(self.path)
+        index = {'stat': [st.st_size, st.st_mtime_ns],
+                 'keys': sorted(self.keys), 'ids': sorted(self.ids)}
+        with open(self.index_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(index, f, ensure_ascii=False)
+        os.replace(self.index_path + '.tmp', self.index_path)
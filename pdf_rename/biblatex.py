@@ -0,0 +1,98 @@
+"""biblatex entries for records."""
+from .names import name_authors
+
+
+def citekey(names, record):
+    """Return the default citekey for record, given name_authors(...)."""
+    return names[0] + record.year
+
+
+def article_entry(record, key=None):
+    """Return a biblatex @article entry for record."""
+    names = name_authors(record.authors)
+    key = key or citekey(names, record)
+    entry = "@article{" + key + ",\n" \
+            + "    author = {" + names[2] + "},\n" \
+            + "    title = {" + record.title + "},\n" \
+            + "    subtitle = {" + record.subtitle + "},\n" \
+            + "    year = {" + record.year + "},\n" \
+            + "    journaltitle = {" + record.journaltitle + "},\n" \
+            + "    shortjournaltitle = {" + record.shortjournaltitle + "},\n" \
+            + "    volume = {" + record.volume + "},\n" \
+            + "    number = {" + record.number + "},\n" \
+            + "    pages = {" + record.page_start + "--" \
+            + record.page_end + "},\n" \
+            + "    doi = {" + record.doi + "},\n" \
+            + "    eid = {" + record.eid + "},\n" \
+            + "}"
+    return entry
+
+
+def book_entry(record, key=None):
+    """Return a biblatex @book or @collection entry for record."""
+    names = name_authors(record.authors)
+    key = key or citekey(names, record)
+    entry = "@" + record.entry_type + "{" + key + ",\n" \
+            + "    " + record.author_type + " = {" + names[2] + "},\n" \
+            + "    year = {" + record.year + "},\n" \
+            + "    title = {" + record.title + "},\n" \
+            + "    subtitle = {" + record.subtitle + "},\n" \
+            + "    editor = {" + name_authors(record.editors)[2] + "},\n" \
+            + "    booktitle = {" + record.booktitle + "},\n" \
+            + "    booksubtitle = {" + record.booksubtitle + "},\n" \
+            + "    series = {" + record.series + "},\n" \
+            + "    number = {" + record.number + "},\n" \
+            + "    location = {" + record.location + "},\n" \
+            + "    publisher = {" + record.publisher + "},\n" \
+            + "    doi = {" + record.doi + "},\n" \
+            + "}"
+    return entry
+
+
+def incollection_entry(record, key=None, collection=True):
+    """
+    Return a biblatex @incollection entry for record, followed by an entry
+    for the collection unless collection is False.
+    """
+    names = name_authors(record.authors)
+    editor_names = name_authors(record.editors)
+    key = key or citekey(names, record)
+    entry = "@" + record.entry_type + "{" + key + ",\n" \
+            + "    author = {" + names[2] + "},\n" \
+            + "    year = {" + record.year + "},\n" \
+            + "    title = {" + record.title + "},\n" \
+            + "    subtitle = {" + record.subtitle + "},\n" \
+            + "    pages = {" + record.page_start + "--" \
+            + record.page_end + "},\n" \
+            + "    doi = {" + record.doi + "},\n" \
+            + "    crossref = {" + citekey(editor_names, record) + "},\n" \
+            + "}\n"
+    if not collection:
+        return entry
+    entry = entry \
+            + "\n" \
+            + "@collection{" + citekey(editor_names, record) + ",\n" \
+            + "    editor = {" + editor_names[2] + "},\n" \
+            + "    year = {" + record.year + "},\n" \
+            + "    booktitle = {" + record.booktitle + "},\n" \
+            + "    booksubtitle = {" + record.booksubtitle + "},\n" \
+            + "    publisher = {" + record.publisher + "},\n" \
+            + "    location = {" + record.location + "},\n" \
+            + "    doi = {},\n" \
+            + "}\n"
+    return entry
+
+
+def to_biblatex(record, key=None, collection=True):
+    """
+    Return the biblatex entry (or entries) for record.
+
+    key replaces the default citekey. For chapters, the entry of the
+    collection is left out if collection is False.
+    """
+    if record.entry_type == "book" or record.entry_type == "collection":
+        return book_entry(record, key)
+    elif record.entry_type == "incollection":
+        return incollection_entry(record, key, collection)
+    else:
+        return article_entry(record, key)
@@ -0,0 +1,175 @@
+"""Persistent cache of parse results."""
+import dataclasses
+import hashlib
+import json
+import os
+import sqlite3
+import time
+
+from .journals import registry
+from .mapped import MappedFile
+from .record import Record
+from .text import HEAD_FRACTION
+
+# Cached results (see ResultCache) are only used if they were produced
+# with the same version. Increase it whenever the code shared by the
+# parsers changes what they extract; changes to the parsers themselves are
+# covered by cache_version.
+PARSER_VERSION = 5
+
+
+# The databases are kept in the user's cache directory. The paths are
+# expanded when a database is opened (see expand_path), so that the
+# defaults shown by --help do not depend on the machine.
+CACHE_HOME = os.path.join('~', '.cache')
+CACHE_PATH = os.path.join(CACHE_HOME, 'pdf-rename', 'cache.sqlite')
+
+
+CACHE_SIZE = 64  # MB
+
+
+def expand_path(path):
+    """
+    Return path with CACHE_HOME replaced by $XDG_CACHE_HOME (if set) and
+    '~' expanded.
+    """
+    if os.environ.get('XDG_CACHE_HOME') and (
+            path == CACHE_HOME or path.startswith(CACHE_HOME + os.sep)):
+        path = os.environ['XDG_CACHE_HOME'] + path[len(CACHE_HOME):]
+    return os.path.expanduser(path)
+
+
+def file_digest(filename, mapped=None):
+    """
+    Return the SHA-256 hex digest of the contents of filename, hashed
+    from the MappedFile mapped if given.
+    """
+    if mapped is None:
+        with MappedFile(filename) as mapped:
+            return file_digest(filename, mapped)
+    return hashlib.sha256(mapped.data).hexdigest()
+
+
+def cache_version(head_fraction=HEAD_FRACTION):
+    """
+    Return the version of the parsers, for invalidating cached results.
+
+    Besides PARSER_VERSION, this covers the journals and the parsers,
+    including the source of their modules and the versions of plugins
+    (see ParserRegistry.signature), so that changing a parser invalidates
+    the cached records, and head_fraction, which changes what the parsers
+    that only need the head of the page see (see PageText).
+    PARSER_VERSION has to be increased by hand when the code they share
+    (e.g. pdf_rename.text or pdf_rename.parse) changes what they extract.
+    """
+    table = registry.signature() + repr(float(head_fraction))
+    return str(PARSER_VERSION) + '-' + \
+        hashlib.sha256(table.encode('utf-8')).hexdigest()[:16]
+
+
+class ResultCache:
+    """
+    Persistent cache of parse results, keyed by the content of the PDF.
+
+    Records are stored as JSON in an SQLite database together with the
+    parser version (see cache_version) and are only returned for the same
+    version, parsed with the same head_fraction. When the stored records
+    grow beyond max_size bytes, the least recently used ones are evicted.
+    Hits and misses are counted in hits and misses, and added to the
+    totals in the database by close().
+    """
+
+    def __init__(self, path, max_size=CACHE_SIZE << 20,
+                 head_fraction=HEAD_FRACTION):
+        path = expand_path(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.max_size = max_size
+        self.version = cache_version(head_fraction)
+        self.hits = 0
+        self.misses = 0
+        self._unsaved = 0
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS results ('
+                        'digest TEXT PRIMARY KEY, version TEXT, '
+                        'fields TEXT, size INTEGER, used REAL)')
+        self.db.execute('CREATE TABLE IF NOT EXISTS stats ('
+                        'name TEXT PRIMARY KEY, value INTEGER)')
+        self.db.commit()
+
+    def get(self, digest):
+        """
+        Return the cached record for digest and the key of the parser that
+        produced it (or None), or None if there is no record.
+        """
+        row = self.db.execute('SELECT fields FROM results '
+                              'WHERE digest = ? AND version = ?',
+                              (digest, self.version)).fetchone()
+        if row is None:
+            return None
+        fields = json.loads(row[0])
+        return Record(**{field.name: fields[field.name]
+                         for field in dataclasses.fields(Record)
+                         if field.name in fields}), fields.get('journal')
+
+    def touch(self, digest):
+        """Mark the record for digest as used now."""
+        self.db.execute('UPDATE results SET used = ? WHERE digest = ?',
+                        (time.time(), digest))
+
+    def put(self, digest, record, journal=None):
+        """
+        Store record (parsed by the parser journal) for digest, committing
+        every 100 records.
+        """
+        fields = dataclasses.asdict(record)
+        fields['journal'] = journal
+        fields = json.dumps(fields, ensure_ascii=False)
+        self.db.execute('INSERT OR REPLACE INTO results '
+                        'VALUES (?, ?, ?, ?, ?)',
+                        (digest, self.version, fields, len(fields),
+                         time.time()))
+        self._unsaved = self._unsaved + 1
+        if self._unsaved >= 100:
+            self.db.commit()
+            self._unsaved = 0
+
+    def commit(self):
+        """Save the records stored so far."""
+        self.db.commit()
+        self._unsaved = 0
+
+    def clear(self):
+        """Remove all cached records."""
+        self.db.execute('DELETE FROM results')
+        self.db.commit()
+
+    def evict(self):
+        """Remove the least recently used records beyond max_size."""
+        size = self.db.execute('SELECT TOTAL(size) FROM results').fetchone()
+        excess = size[0] - self.max_size
+        if excess <= 0:
+            return
+        rows = self.db.execute('SELECT digest, size FROM results '
+                               'ORDER BY used')
+        evicted = []
+        for digest, size in rows:
+            if excess <= 0:
+                break
+            evicted.append((digest,))
+            excess = excess - size
+        self.db.executemany('DELETE FROM results WHERE digest = ?', evicted)
+
+    def close(self):
+        """Evict, save the hit and miss counts and close the database."""
+        self.evict()
+        for name, value in (('hits', self.hits), ('misses', self.misses)):
+            self.db.execute('INSERT OR IGNORE INTO stats VALUES (?, 0)',
+                            (name,))
+            self.db.execute('UPDATE stats SET value = value + ? '
+                            'WHERE name = ?', (value, name))
+        self.db.commit()
+        self.db.close()
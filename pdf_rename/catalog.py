@@ -0,0 +1,136 @@
+"""Full-text catalog of the fields and first pages of the library."""
+import dataclasses
+import json
+import os
+import sqlite3
+
+from .cache import CACHE_PATH, expand_path
+from .record import Record
+
+CATALOG_PATH = os.path.join(os.path.dirname(CACHE_PATH), 'catalog.sqlite')
+
+
+# Maximum number of files returned by Catalog.search.
+SEARCH_LIMIT = 100
+
+
+# Columns of the full-text index, in the order of the search table.
+COLUMNS = ('authors', 'title', 'journaltitle', 'year', 'doi', 'text')
+
+
+class Catalog:
+    """
+    Persistent catalog of files, searchable by their fields and the text
+    of their first page.
+
+    The record of each file is stored as JSON in an SQLite database, with
+    an FTS5 index (the table 'search') of its authors, title, journal,
+    year, DOI and first-page text, so that searching does not read any
+    PDFs. Files that no longer exist are left out of the results.
+    """
+
+    def __init__(self, path):
+        path = expand_path(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS files ('
+                        'id INTEGER PRIMARY KEY, path TEXT UNIQUE, '
+                        'digest TEXT, journal TEXT, fields TEXT, ' +
+                        ', '.join(COLUMNS) + ')')
+        self.db.execute('CREATE INDEX IF NOT EXISTS files_digest '
+                        'ON files (digest)')
+        # An external content table: the index refers to the rows of
+        # files, and is kept up to date by triggers.
+        self.db.execute('CREATE VIRTUAL TABLE IF NOT EXISTS search '
+                        'USING fts5(' + ', '.join(COLUMNS) + ', '
+                        "content='files', content_rowid='id', "
+                        "tokenize='unicode61 remove_diacritics 2')")
+        columns = ', '.join(COLUMNS)
+        new = ('INSERT INTO search (rowid, ' + columns + ') VALUES (' +
+               ', '.join('new.' + name for name in ('id',) + COLUMNS) + ')')
+        old = ('INSERT INTO search (search, rowid, ' + columns + ') '
+               "VALUES ('delete', " +
+               ', '.join('old.' + name for name in ('id',) + COLUMNS) + ')')
+        for name, event, body in (('files_insert', 'INSERT', new),
+                                  ('files_delete', 'DELETE', old),
+                                  ('files_update', 'UPDATE',
+                                   old + '; ' + new)):
+            self.db.execute('CREATE TRIGGER IF NOT EXISTS ' + name +
+                            ' AFTER ' + event + ' ON files BEGIN ' + body +
+                            '; END')
+        self.db.commit()
+
+    def add(self, path, record, journal=None, digest=None, text=None):
+        """
+        Catalog path with its record (parsed by the parser journal), its
+        content hash digest and the text of its first page.
+
+        Without text (e.g. for records from the cache), the text stored
+        earlier for path or for another file with the same digest is kept.
+        """
+        path = os.path.abspath(path)
+        if text is None and digest:
+            row = self.db.execute('SELECT text FROM files WHERE digest = ? '
+                                  'AND text IS NOT NULL', (digest,))
+            text = (row.fetchone() or (None,))[0]
+        fields = dataclasses.asdict(record)
+        self.db.execute('INSERT INTO files (path, digest, journal, fields, ' +
+                        ', '.join(COLUMNS) + ') VALUES (' +
+                        ', '.join('?' * (4 + len(COLUMNS))) + ') '
+                        'ON CONFLICT (path) DO UPDATE SET ' +
+                        ', '.join(name + ' = excluded.' + name
+                                  for name in ('digest', 'journal', 'fields') +
+                                  COLUMNS[:-1]) +
+                        ', text = COALESCE(excluded.text, text)',
+                        (path, digest, journal,
+                         json.dumps(fields, ensure_ascii=False),
+                         '; '.join(record.authors + record.editors),
+                         ': '.join(filter(None, (record.title,
+                                                 record.subtitle))),
+                         record.journaltitle or record.booktitle,
+                         record.year, record.doi.lower(), text))
+
+    def remove(self, path):
+        """Drop the entry of path, e.g. after it was renamed."""
+        self.db.execute('DELETE FROM files WHERE path = ?',
+                        (os.path.abspath(path),))
+
+    def _match(self, query, limit):
+        return self.db.execute(
+            'SELECT files.path, files.fields, files.journal, '
+            "snippet(search, 5, '[', ']', '...', 12) "
+            'FROM search JOIN files ON files.id = search.rowid '
+            'WHERE search MATCH ? ORDER BY rank LIMIT ?',
+            (query, limit)).fetchall()
+
+    def search(self, query, limit=SEARCH_LIMIT):
+        """
+        Return the files matching query, best matches first, as (path,
+        record, journal, snippet) tuples, where snippet is the matching
+        part of the first-page text (if any).
+
+        query uses the FTS5 syntax (e.g. 'title:syntax AND year:2019');
+        if it is not valid, its words are searched for as they are.
+        """
+        try:
+            rows = self._match(query, limit)
+        except sqlite3.OperationalError:
+            words = ['"' + word.replace('"', '""') + '"'
+                     for word in query.split()]
+            rows = self._match(' '.join(words), limit) if words else []
+        results = []
+        for path, fields, journal, snippet in rows:
+            if os.path.exists(path):
+                fields = json.loads(fields)
+                results.append((path, Record(**fields), journal, snippet))
+        return results
+
+    def commit(self):
+        self.db.commit()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
@@ -0,0 +1,676 @@
+"""Command line interface of pdf-rename."""
+import argparse
+import collections
+import concurrent.futures
+import cProfile
+import dataclasses
+import functools
+import itertools
+import json
+import os
+import sys
+import tracemalloc
+import types
+
+from .bibfile import BibFile
+from .biblatex import to_biblatex
+from .cache import CACHE_PATH, CACHE_SIZE, ResultCache, file_digest
+from .catalog import CATALOG_PATH, Catalog
+from .dedupe import INDEX_PATH, LibraryIndex
+from .files import (RenamePlan, find_pdfs, new_filename, rename,
+                    replace_with_link)
+from .manifest import MANIFEST_PATH, Manifest
+from .mapped import MappedFile
+from .names import name_authors
+from .parse import parse_pdf
+from .prefetch import PREFETCH_DEPTH, prefetch
+from .profiling import Timings, merge_profiles, profile_path
+from .record import PDFRenameError
+from .text import HEAD_FRACTION, PageText
+from .watch import SETTLE_TIME, watch
+
+
+def handle_record(filename, record, args, bib=None, timings=None,
+                  plan=None):
+    """
+    Rename filename and print the biblatex entry as requested in args, and
+    add it to the BibFile bib (if not None).
+
+    The new filename is taken from the RenamePlan plan, if given. Returns
+    it if the file was copied or renamed (or would have been, with
+    args.dry_run), else None. The stages are timed in timings, if given.
+    Messages and the entry are only printed with the text format (see
+    print_json for jsonl).
+    """
+    timings = timings or Timings()
+    text = args.format == 'text'
+    if args.biblatex and text:
+        for note in record.notes:
+            print(note + "\n")
+
+    pub = record.shortjournaltitle or record.publisher
+    with timings.stage('names'):
+        names = name_authors(record.authors)
+        if plan and (args.copy or args.rename):
+            target = plan.target(filename, record)
+        else:
+            target = new_filename(filename, record)
+
+    if args.copy and text:
+        print("We're looking at", "“" + record.title + "”", "by",
+              names[1], "from", record.year, "in",
+              pub + ".\n")
+        # Rename file (cp)
+        print("Would copy file to:" if args.dry_run else
+              "Okay, renaming file to (keeping original):",
+              os.path.basename(target) + "\n")
+    if args.copy and not args.dry_run:
+        with timings.stage('rename'):
+            rename(record, filename, copy=True, hardlink=args.link,
+                   target=target)
+
+    if args.rename and text:
+        print("We're looking at", "“" + record.title + "”", "by",
+              names[1], "from", record.year,
+              "in", pub + ".\n")
+        # Rename file (mv)
+        print("Would rename file to:" if args.dry_run else
+              "Okay, renaming file to:", os.path.basename(target) + "\n")
+    if args.rename and not args.dry_run:
+        with timings.stage('rename'):
+            rename(record, filename, target=target)
+        if plan and target != filename:
+            plan.moved(filename)
+
+    with timings.stage('output'):
+        if args.biblatex and text:
+            print(to_biblatex(record))
+
+        if bib:
+            bib.add(record)
+
+    if args.copy or args.rename:
+        return target
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='Rename PDFs automatically \
+                                    to include author(s), year, and title.')
+    parser.add_argument('filename', metavar='filename', type=str, nargs='*',
+                        help='PDFs or directories of PDFs to rename')
+    parser.add_argument('--biblatex', action='store_true',
+                        help='create biblatex entry')
+    parser.add_argument('--format', choices=('text', 'jsonl'),
+                        default='text',
+                        help='print messages and entries as text, or one ' +
+                             'JSON object per file with its fields, ' +
+                             'journal, new name and status (default: text)')
+    parser.add_argument('--copy', action='store_true',
+                        help='rename PDF file and keep original')
+    parser.add_argument('--rename', action='store_true',
+                        help='rename PDF file and delete original')
+    parser.add_argument('--dry-run', action='store_true',
+                        help='only print the new names for --copy or ' +
+                             '--rename; names that are taken get a ' +
+                             'suffix after the year, e.g. (2019a)')
+    parser.add_argument('--link', action='store_true',
+                        help='with --copy, hard-link the new name instead ' +
+                             'of copying the file')
+    parser.add_argument('--bib-out', metavar='FILE',
+                        help='append biblatex entries to FILE, skipping ' +
+                             'entries already in it')
+    parser.add_argument('--glob', metavar='PATTERN', action='append',
+                        help='only process files in directories matching ' +
+                             'PATTERN (default: *.pdf, *.PDF); can be ' +
+                             'given several times')
+    parser.add_argument('--no-recursive', dest='recursive',
+                        action='store_false',
+                        help='do not descend into subdirectories')
+    parser.add_argument('--jobs', '-j', metavar='N', type=int, default=0,
+                        help='number of worker processes for parsing ' +
+                             '(default: number of CPUs)')
+    parser.add_argument('--prefetch', metavar='N', type=int,
+                        default=PREFETCH_DEPTH,
+                        help='number of files whose start and end are ' +
+                             'read ahead of parsing, e.g. on network ' +
+                             'file systems; 0 disables reading ahead ' +
+                             '(default: ' + str(PREFETCH_DEPTH) + ')')
+    parser.add_argument('--head-fraction', metavar='F', type=float,
+                        default=HEAD_FRACTION,
+                        help='fraction of the first page laid out for ' +
+                             'journals that only need its head; 1 lays ' +
+                             'out the whole page (default: ' +
+                             str(HEAD_FRACTION) + ')')
+    parser.add_argument('--cache', metavar='FILE', default=CACHE_PATH,
+                        help='database of earlier results, looked up by ' +
+                             'file content (default: ' + CACHE_PATH + ')')
+    parser.add_argument('--cache-size', metavar='MB', type=int,
+                        default=CACHE_SIZE,
+                        help='evict the least recently used results ' +
+                             'beyond this size (default: ' +
+                             str(CACHE_SIZE) + ')')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='neither use nor update the cache')
+    parser.add_argument('--rebuild-cache', action='store_true',
+                        help='empty the cache and parse all files again')
+    parser.add_argument('--incremental', action='store_true',
+                        help='skip files that are unchanged since they ' +
+                             'were last processed')
+    parser.add_argument('--manifest', metavar='FILE', default=MANIFEST_PATH,
+                        help='record of processed files for ' +
+                             '--incremental (default: ' + MANIFEST_PATH +
+                             ')')
+    parser.add_argument('--dedupe', choices=('report', 'link'),
+                        help='report files with the same content or DOI as ' +
+                             'a file seen before, without parsing copies; ' +
+                             'with "link", replace copies with hard links')
+    parser.add_argument('--index', metavar='FILE', default=INDEX_PATH,
+                        help='index of the library by content and DOI for ' +
+                             '--dedupe (default: ' + INDEX_PATH + ')')
+    parser.add_argument('--catalog', action='store_true',
+                        help='add the fields and the first-page text of ' +
+                             'the files to a full-text catalog')
+    parser.add_argument('--catalog-file', metavar='FILE',
+                        default=CATALOG_PATH,
+                        help='catalog for --catalog and --search ' +
+                             '(default: ' + CATALOG_PATH + ')')
+    parser.add_argument('--search', metavar='QUERY',
+                        help='print the files in the catalog matching ' +
+                             'QUERY (FTS5 syntax, e.g. "title:syntax ' +
+                             'year:2019"), without reading any PDFs')
+    parser.add_argument('--timings', action='store_true',
+                        help='print the time spent in each stage, the ' +
+                             'peak memory and whether the page text was ' +
+                             'needed for each file as a JSON line to stderr')
+    parser.add_argument('--profile', metavar='DIR',
+                        help='write cProfile statistics for each file, ' +
+                             'and merged for each journal, to DIR')
+    parser.add_argument('--watch', action='store_true',
+                        help='keep running and handle PDFs as they are ' +
+                             'written or moved into the directories given')
+    parser.add_argument('--settle', metavar='SECONDS', type=float,
+                        default=SETTLE_TIME,
+                        help='with --watch, wait until a file has not ' +
+                             'changed for SECONDS (default: ' +
+                             str(SETTLE_TIME) + ')')
+    args = parser.parse_args(argv)
+    if not args.filename and args.search is None:
+        parser.error('the following arguments are required: filename')
+    if args.filename and args.search is not None:
+        parser.error('--search takes no filenames')
+    if args.watch and not all(os.path.isdir(path)
+                              for path in args.filename):
+        parser.error('--watch needs directories')
+    if args.dry_run and not (args.copy or args.rename or args.dedupe):
+        parser.error('--dry-run needs --copy, --rename or --dedupe')
+    return args
+
+
+# Caches opened by parse_job, per process (connections must not be shared
+# with forked worker processes).
+_caches = {}
+_indexes = {}
+
+
+def open_cache(path, head_fraction):
+    """
+    Return this process's ResultCache for path, for results parsed with
+    head_fraction.
+    """
+    key = (path, head_fraction, os.getpid())
+    if key not in _caches:
+        _caches[key] = ResultCache(path, head_fraction=head_fraction)
+    return _caches[key]
+
+
+def open_index(path):
+    """Return this process's LibraryIndex for path."""
+    key = (path, os.getpid())
+    if key not in _indexes:
+        _indexes[key] = LibraryIndex(path)
+    return _indexes[key]
+
+
+def parse_cached(filename, options, timings, report=None):
+    """
+    Parse filename, returning a (record, error message, digest, cached)
+    tuple.
+
+    If options.cache is set, the record is looked up in that ResultCache
+    first (unless options.rebuild_cache is set); cached is True for
+    records from the cache. If options.index is set and the file is a copy
+    of a file in that LibraryIndex, it is not parsed and the record is
+    None. The stages are timed in timings. The file is mapped into memory
+    once, for hashing and parsing (see MappedFile). With options.catalog,
+    the text of the first page, as far as it was laid out for parsing (see
+    PageText.text), is stored in report['text'].
+    """
+    digest = None
+    try:
+        with MappedFile(filename) as mapped:
+            if options.cache or options.index:
+                with timings.stage('digest'):
+                    digest = file_digest(filename, mapped)
+            if options.index:
+                with timings.stage('dedupe'):
+                    copies = open_index(options.index).copies(filename,
+                                                              digest)
+                if copies:
+                    return None, None, digest, False
+            if options.cache and not options.rebuild_cache:
+                with timings.stage('cache'):
+                    hit = open_cache(options.cache,
+                                     options.head_fraction).get(digest)
+                if hit is not None:
+                    record, timings.journal = hit
+                    return record, None, digest, True
+            page_text = PageText(filename, options.head_fraction, timings,
+                                 mapped)
+            try:
+                return parse_pdf(filename, options.head_fraction, timings,
+                                 mapped, page_text), None, digest, False
+            finally:
+                if options.catalog and report is not None:
+                    report['text'] = page_text.text()
+    except Exception as error:
+        return None, str(error), digest, False
+
+
+def parse_job(filename, options):
+    """
+    Parse filename, returning a (record, error message, digest, cached,
+    report) tuple (see parse_cached).
+
+    Used as the unit of work in the process pool, so that failures are
+    reported by the parent in the same order as successful files. Storing
+    new records in the cache is left to the parent.
+
+    report is a dictionary with the times of the stages of parsing
+    ('stages') and the key of the parser used ('journal'); a file whose
+    stages do not include 'layout' was parsed from its metadata alone.
+    With options.catalog, it has the text of the first page ('text', see
+    parse_cached). With options.timings, it also has the peak memory
+    allocated while parsing ('memory'), and with options.profile the path
+    of the cProfile dump ('profile', written to the directory
+    options.profile).
+    """
+    timings = Timings()
+    report = {}
+    if not (options.timings or options.profile):
+        result = parse_cached(filename, options, timings, report)
+        report['stages'] = timings.stages
+        report['journal'] = timings.journal
+        return result + (report,)
+    profiler = None
+    if options.profile:
+        profiler = cProfile.Profile()
+        profiler.enable()
+    if options.timings:
+        tracemalloc.start()
+    try:
+        result = parse_cached(filename, options, timings, report)
+    finally:
+        if options.timings:
+            report['memory'] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if profiler:
+            profiler.disable()
+            report['profile'] = profile_path(options.profile, filename)
+            profiler.dump_stats(report['profile'])
+    report['stages'] = timings.stages
+    report['journal'] = timings.journal
+    return result + (report,)
+
+
+def parse_chunk(filenames, options):
+    """Return the results of parse_job for filenames."""
+    return [parse_job(filename, options) for filename in filenames]
+
+
+def parse_all(filenames, jobs, options, depth=PREFETCH_DEPTH):
+    """
+    Yield the results of parse_job for filenames, in input order.
+
+    With more than one job, the files are parsed by a pool of worker
+    processes. Only parsing happens in the workers; renaming and output
+    are left to the caller in the parent process. The heads and tails of
+    the next depth files are read ahead by I/O threads (see prefetch), and
+    only as many files are handed to the workers as they can work on, so
+    that reading ahead keeps pace with parsing.
+    """
+    upcoming = prefetch(filenames, depth)
+    job = functools.partial(parse_job, options=options)
+    if jobs == 1 or len(filenames) < 2:
+        yield from map(job, upcoming)
+        return
+    chunksize = max(1, min(16, len(filenames) // (jobs * 4)))
+    with concurrent.futures.ProcessPoolExecutor(jobs) as executor:
+        pending = collections.deque()
+        while True:
+            chunk = list(itertools.islice(upcoming, chunksize))
+            if chunk:
+                pending.append(executor.submit(parse_chunk, chunk, options))
+            if pending and (not chunk or len(pending) > 2 * jobs):
+                yield from pending.popleft().result()
+            elif not chunk:
+                break
+
+
+def update_manifest(manifest, filename, target, args, ok):
+    """Record filename (and its copy or new name target) in manifest."""
+    if target is not None and os.path.exists(target):
+        if args.rename:
+            manifest.move(filename, target)
+        manifest.add(target, ok)
+    if os.path.exists(filename):
+        manifest.add(filename, ok)
+
+
+def process(filename, result, args, cache, manifest, bib, plan=None,
+            index=None, catalog=None):
+    """
+    Rename and print filename after its parse_job result, as requested in
+    args, and update cache, manifest and bib (if not None). New names are
+    taken from the RenamePlan plan, if given. With the LibraryIndex index,
+    copies of indexed files are reported (see handle_copy) instead, and
+    other files are indexed (see index_file). Parsed files are added to
+    the Catalog catalog, if given (see catalog_file).
+
+    Errors are reported on stderr, and so are the timings with
+    args.timings. Returns an (ok, target) tuple, where target is the new
+    filename as returned by handle_record.
+    """
+    record, error, digest, cached, report = result
+    timings = Timings()
+    timings.update(report['stages'])
+    # Copies found by --dedupe are neither parsed nor looked up.
+    if cache and digest and (record is not None or error is not None):
+        with timings.stage('cache'):
+            if cached:
+                cache.hits = cache.hits + 1
+                cache.touch(digest)
+            else:
+                cache.misses = cache.misses + 1
+                if record is not None:
+                    cache.put(digest, record, report['journal'])
+    target = None
+    ok = True
+    found = {}
+    try:
+        copies = index.copies(filename, digest) if index else []
+        if copies:
+            with timings.stage('dedupe'):
+                found = handle_copy(filename, copies[0], args)
+                index.add(filename, digest)
+        else:
+            if error is not None:
+                raise PDFRenameError(error)
+            target = handle_record(filename, record, args, bib, timings,
+                                   plan)
+            if index:
+                with timings.stage('dedupe'):
+                    found = index_file(index, filename, target, record,
+                                       digest, args)
+            if catalog:
+                with timings.stage('catalog'):
+                    catalog_file(catalog, filename, target, record, digest,
+                                 report, args)
+    except Exception as exception:
+        # One broken file must not stop a batch run.
+        ok = False
+        error = str(exception)
+    if manifest and not args.dry_run:
+        try:
+            with timings.stage('manifest'):
+                update_manifest(manifest, filename, target, args, ok)
+        except Exception as exception:
+            if ok:
+                ok = False
+                error = str(exception)
+    if not ok and args.format == 'text':
+        report_error(filename, error, args)
+    if args.format == 'jsonl':
+        with timings.stage('output'):
+            print_json(filename, record, report['journal'], target, error,
+                       args.biblatex, found)
+    if args.timings:
+        print_timings(filename, report, timings, cached, ok)
+    return ok, target
+
+
+def report_error(filename, error, args):
+    """Report the error message for filename, in the format of args."""
+    if args.format == 'jsonl':
+        print_json(filename, None, None, None, error)
+    else:
+        print(filename + ": " + error, file=sys.stderr)
+
+
+def handle_copy(filename, original, args):
+    """
+    Report filename as a copy of original (an indexed file with the same
+    content) and, with --dedupe link, replace it with a hard link to
+    original. Returns the fields for print_json.
+    """
+    linked = False
+    if os.path.samefile(original, filename):
+        note = " (linked)"
+    elif args.dedupe == 'link' and not args.dry_run:
+        linked = replace_with_link(original, filename)
+        note = " (replaced with a link)"
+    else:
+        note = ""
+    if args.format == 'text':
+        print(filename + ": same content as " + original + note)
+    return {'status': 'duplicate', 'duplicate_of': original,
+            'linked': linked}
+
+
+def index_file(index, filename, target, record, digest, args):
+    """
+    Add filename (as renamed or copied to target, if so) to the
+    LibraryIndex index and report the other files with the same DOI.
+    Returns the fields for print_json.
+    """
+    versions = index.versions(filename, record.doi)
+    if versions and args.format == 'text':
+        print(filename + ": same DOI as " + ", ".join(versions))
+    if target and args.rename and not args.dry_run:
+        index.remove(filename)
+    else:
+        index.add(filename, digest, record.doi)
+    if target and not args.dry_run:
+        index.add(target, digest, record.doi)
+    return {'versions': versions}
+
+
+def catalog_file(catalog, filename, target, record, digest, report, args):
+    """
+    Add filename (as renamed or copied to target, if so) to the Catalog
+    catalog, with the first-page text in its parse_job report.
+    """
+    entry = (record, report['journal'], digest, report.get('text'))
+    if target and args.rename and not args.dry_run:
+        catalog.remove(filename)
+    else:
+        catalog.add(filename, *entry)
+    if target and not args.dry_run:
+        catalog.add(target, *entry)
+
+
+def search(args):
+    """Print the files in the catalog matching args.search."""
+    catalog = Catalog(args.catalog_file)
+    for path, record, journal, snippet in catalog.search(args.search):
+        if args.format == 'jsonl':
+            result = {'file': path, 'journal': journal, 'snippet': snippet}
+            result.update(dataclasses.asdict(record))
+            print(json.dumps(result, ensure_ascii=False))
+            continue
+        print(path + ": " + ", ".join(record.authors) + " (" +
+              record.year + "): " + record.title)
+        if '[' in (snippet or ''):
+            print("    " + " ".join(snippet.split()))
+    catalog.close()
+
+
+def print_json(filename, record, journal, target, error, biblatex=False,
+               found=None):
+    """
+    Print the result for filename as a JSON line: its status, the error
+    message (if any), the parser key, the new filename (target, or the name
+    the file would get) and the fields of record, if parsed, with the
+    biblatex entry if biblatex is true. found has the results of --dedupe
+    (see handle_copy and index_file).
+    """
+    result = {'file': filename, 'status': 'error' if error else 'ok',
+              'error': error, 'journal': journal, 'target': target}
+    if found and not error:
+        result.update(found)
+    if record is not None:
+        if target is None:
+            try:
+                result['target'] = new_filename(filename, record)
+            except Exception:
+                pass
+        result.update(dataclasses.asdict(record))
+        if biblatex:
+            result['biblatex'] = to_biblatex(record)
+    print(json.dumps(result, ensure_ascii=False), flush=True)
+
+
+def print_timings(filename, report, timings, cached, ok):
+    """Print the timings of processing filename as a JSON line to stderr."""
+    stages = {name: round(seconds * 1000, 3)
+              for name, seconds in timings.stages.items()}
+    print(json.dumps({'file': filename, 'journal': report['journal'],
+                      'cached': cached, 'ok': ok,
+                      'page_text': 'layout' in timings.stages,
+                      'total_ms': round(sum(stages.values()), 3),
+                      'stages_ms': stages,
+                      'peak_memory_kb': report['memory'] // 1024},
+                     ensure_ascii=False), file=sys.stderr)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.search is not None:
+        search(args)
+        return
+    patterns = args.glob or ['*.pdf', '*.PDF']
+    filenames = []
+    if not args.watch:
+        filenames = list(find_pdfs(args.filename, patterns, args.recursive))
+    jobs = args.jobs or os.cpu_count() or 1
+    manifest = None
+    skipped = 0
+    if args.incremental:
+        manifest = Manifest(args.manifest)
+        found = len(filenames)
+        filenames = [filename for filename in filenames
+                     if not manifest.unchanged(filename)]
+        skipped = found - len(filenames)
+    index = None
+    if args.dedupe:
+        index = LibraryIndex(args.index)
+    catalog = None
+    if args.catalog:
+        catalog = Catalog(args.catalog_file)
+    cache = None
+    if not args.no_cache:
+        cache = ResultCache(args.cache, args.cache_size << 20,
+                            args.head_fraction)
+        if args.rebuild_cache:
+            cache.clear()
+    options = types.SimpleNamespace(
+        head_fraction=args.head_fraction,
+        cache=cache and cache.path,
+        rebuild_cache=args.rebuild_cache,
+        index=args.dedupe and args.index,
+        catalog=args.catalog,
+        timings=args.timings,
+        profile=args.profile)
+    if args.profile:
+        os.makedirs(args.profile, exist_ok=True)
+    bib = None
+    if args.bib_out:
+        bib = BibFile(args.bib_out)
+    failed = 0
+    metadata_only = 0
+    profiles = {}
+
+    def finish(filename, result, plan):
+        """Process the parse_job result for filename."""
+        nonlocal failed, metadata_only
+        ok, target = process(filename, result, args, cache, manifest, bib,
+                             plan, index, catalog)
+        if not ok:
+            failed = failed + 1
+        cached, report = result[3], result[4]
+        if ok and not cached and 'layout' not in report['stages']:
+            metadata_only = metadata_only + 1
+        if 'profile' in report and report['journal']:
+            profiles.setdefault(report['journal'], []).append(
+                report['profile'])
+        return target
+
+    def handle(filename):
+        """Process a file found by watch, in this process."""
+        nonlocal failed
+        target = None
+        try:
+            if manifest and manifest.unchanged(filename):
+                return None
+            # The directories change between files, so they are listed
+            # anew.
+            target = finish(filename, parse_job(filename, options),
+                            RenamePlan())
+            for database in (cache, manifest, index, catalog):
+                if database:
+                    database.commit()
+        except Exception as exception:
+            # One broken file must not stop watching.
+            failed = failed + 1
+            report_error(filename, str(exception), args)
+        sys.stdout.flush()
+        return target
+
+    if args.watch:
+        try:
+            watch(args.filename, handle, patterns, args.recursive,
+                  args.settle)
+        except KeyboardInterrupt:
+            pass
+        except Exception as exception:
+            failed = failed + 1
+            print("Stopped watching: " + str(exception), file=sys.stderr)
+    plan = RenamePlan()
+    results = parse_all(filenames, jobs, options, args.prefetch)
+    for filename, result in zip(filenames, results):
+        finish(filename, result, plan)
+    if profiles:
+        merge_profiles(args.profile, profiles)
+    if bib:
+        bib.close()
+        print("Added " + str(bib.added) + " entries to " + args.bib_out +
+              ", skipped " + str(bib.duplicates) + " already in it.",
+              file=sys.stderr)
+    if manifest:
+        manifest.close()
+        if skipped:
+            print("Skipped " + str(skipped) + " unchanged files.",
+                  file=sys.stderr)
+    if cache:
+        cache.close()
+        if len(filenames) > 1 or args.watch:
+            print("Cache: " + str(cache.hits) + " hits, " +
+                  str(cache.misses) + " misses.", file=sys.stderr)
+    if index:
+        index.close()
+    if catalog:
+        catalog.close()
+    if args.timings and metadata_only:
+        print("Parsed " + str(metadata_only) + " files from their " +
+              "metadata alone, without laying out a page.", file=sys.stderr)
+    if failed:
+        sys.exit(1)
@@ -0,0 +1,78 @@
+"""Index of the files in the library by content and DOI, for deduplication."""
+import os
+import sqlite3
+
+from .cache import CACHE_PATH, expand_path
+
+INDEX_PATH = os.path.join(os.path.dirname(CACHE_PATH), 'library.sqlite')
+
+
+class LibraryIndex:
+    """
+    Persistent index of files by content hash (see file_digest) and DOI.
+
+    Files with the same hash are copies of the one indexed first; files
+    with the same DOI are versions of the same paper. Files that no longer
+    exist are left out when looking up copies and versions.
+    """
+
+    def __init__(self, path):
+        path = expand_path(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('CREATE TABLE IF NOT EXISTS files ('
+                        'path TEXT PRIMARY KEY, digest TEXT, doi TEXT)')
+        self.db.execute('CREATE INDEX IF NOT EXISTS files_digest '
+                        'ON files (digest)')
+        self.db.execute('CREATE INDEX IF NOT EXISTS files_doi ON files (doi)')
+        self.db.commit()
+
+    def _others(self, column, value, path, earlier=False):
+        paths = []
+        rows = self.db.execute('SELECT path FROM files WHERE ' + column +
+                               ' = ? ORDER BY rowid', (value,))
+        for (other,) in rows.fetchall():
+            if other == path:
+                if earlier:
+                    break
+            elif os.path.exists(other):
+                paths.append(other)
+        return paths
+
+    def copies(self, path, digest):
+        """
+        Return the files with the content hash digest indexed before path
+        (all of them, if path is not indexed), i.e. the files path is a
+        copy of.
+        """
+        return self._others('digest', digest, os.path.abspath(path), True)
+
+    def versions(self, path, doi):
+        """Return the other files indexed with the DOI doi (if any)."""
+        if not doi:
+            return []
+        return self._others('doi', doi.lower(), os.path.abspath(path))
+
+    def add(self, path, digest, doi=''):
+        """Index path with its content hash digest and DOI."""
+        # An upsert keeps the rowid, i.e. the order the files were found.
+        self.db.execute('INSERT INTO files VALUES (?, ?, ?) '
+                        'ON CONFLICT (path) DO UPDATE SET '
+                        'digest = excluded.digest, doi = excluded.doi',
+                        (os.path.abspath(path), digest,
+                         (doi or '').lower() or None))
+
+    def remove(self, path):
+        """Drop the entry of path, e.g. after it was renamed."""
+        self.db.execute('DELETE FROM files WHERE path = ?',
+                        (os.path.abspath(path),))
+
+    def commit(self):
+        self.db.commit()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
@@ -0,0 +1,245 @@
+"""Renaming and copying PDFs after their records."""
+import errno
+import fcntl
+import fnmatch
+import itertools
+import os
+import shutil
+import string
+
+from .names import name_authors
+from .record import PDFRenameError
+
+FICLONE = 0x40049409  # from <linux/fs.h>
+
+
+def new_filename(filename, record, suffix=''):
+    """
+    Return the path the PDF filename is renamed to, with suffix after the
+    year (see RenamePlan).
+    """
+    return os.path.join(os.path.dirname(filename),
+                        name_authors(record.authors)[1] +
+                        ' (' + record.year + suffix + ')' + ' - ' +
+                        record.title + '.pdf')
+
+
+def suffixes():
+    """Yield '', then the suffixes for taken names: a, ..., z, 27, 28, ..."""
+    yield ''
+    yield from string.ascii_lowercase
+    yield from map(str, itertools.count(27))
+
+
+class RenamePlan:
+    """
+    New names for a batch of files that do not collide with each other or
+    with existing files.
+
+    The names in each directory are listed once and kept in memory along
+    with the names given out. If the new name of a file is taken, its year
+    gets the first free suffix (2019a, 2019b, ...), as citekeys do in a
+    .bib file (see BibFile).
+    """
+
+    def __init__(self):
+        self.names = {}
+
+    def taken(self, directory):
+        """Return the set of names taken in directory."""
+        if directory not in self.names:
+            try:
+                self.names[directory] = set(os.listdir(directory or '.'))
+            except OSError:
+                self.names[directory] = set()
+        return self.names[directory]
+
+    def target(self, filename, record):
+        """Return the new path of filename, and reserve it."""
+        taken = self.taken(os.path.dirname(filename))
+        for suffix in suffixes():
+            target = new_filename(filename, record, suffix)
+            if target == filename or os.path.basename(target) not in taken:
+                break
+        taken.add(os.path.basename(target))
+        return target
+
+    def moved(self, filename):
+        """Free the name of filename, which was renamed."""
+        self.taken(os.path.dirname(filename)).discard(
+            os.path.basename(filename))
+
+
+def copy_data(source, target):
+    """
+    Copy the contents of the open file source to the open file target.
+
+    The data are shared (reflinked) where the filesystem supports it, and
+    otherwise copied in the kernel if possible.
+    """
+    try:
+        fcntl.ioctl(target.fileno(), FICLONE, source.fileno())
+        return
+    except OSError:
+        pass
+    if hasattr(os, 'copy_file_range'):
+        try:
+            while os.copy_file_range(source.fileno(), target.fileno(),
+                                     1 << 30):
+                pass
+            return
+        except OSError as error:
+            if target.tell() or error.errno not in (errno.EXDEV,
+                                                    errno.EINVAL,
+                                                    errno.ENOSYS,
+                                                    errno.EOPNOTSUPP):
+                raise
+    shutil.copyfileobj(source, target, 1 << 20)
+
+
+def link(source, target):
+    """
+    Hard-link source as target, which must not exist yet.
+
+    Raises PDFRenameError if target exists (and is not source itself).
+    Returns False if target is source, else True.
+    """
+    try:
+        os.link(source, target)
+    except FileExistsError:
+        if os.path.samefile(source, target):
+            return False
+        raise PDFRenameError(target + ' already exists')
+    return True
+
+
+def place(source, target):
+    """
+    Rename source to target on the same filesystem, unless target exists.
+
+    The new name is linked before the old one is removed, so the file is
+    never lost and an existing target is never replaced. Returns False if
+    target is source already, else True.
+    """
+    try:
+        if not link(source, target):
+            return False
+    except OSError as error:
+        if error.errno not in (errno.EPERM, errno.EOPNOTSUPP, errno.EMLINK):
+            raise
+        # Without hard links (e.g. on FAT), check before renaming.
+        if os.path.lexists(target):
+            if os.path.samefile(source, target):
+                return False
+            raise PDFRenameError(target + ' already exists')
+        os.rename(source, target)
+        return True
+    os.unlink(source)
+    return True
+
+
+def copy_file(source, target, hardlink=False):
+    """
+    Copy source to target without overwriting an existing file.
+
+    The copy is written under a temporary name and then renamed to target,
+    so target is never seen incomplete. With hardlink, target becomes a
+    hard link to source instead.
+    """
+    if hardlink:
+        link(source, target)
+        return
+    directory, name = os.path.split(target)
+    temporary = os.path.join(directory, '.' + name + '.' +
+                             str(os.getpid()) + '.tmp')
+    try:
+        with open(source, 'rb') as src, open(temporary, 'xb') as dst:
+            copy_data(src, dst)
+        shutil.copymode(source, temporary)
+        place(temporary, target)
+    finally:
+        if os.path.lexists(temporary):
+            os.unlink(temporary)
+
+
+def replace_with_link(source, target):
+    """
+    Replace target (a copy of source) with a hard link to source.
+
+    Returns False if they already are the same file. The link is made
+    under a temporary name and renamed over target, so target never goes
+    missing.
+    """
+    if os.path.samefile(source, target):
+        return False
+    directory, name = os.path.split(target)
+    temporary = os.path.join(directory, '.' + name + '.' +
+                             str(os.getpid()) + '.tmp')
+    os.link(source, temporary)
+    try:
+        os.replace(temporary, target)
+    finally:
+        if os.path.lexists(temporary):
+            os.unlink(temporary)
+    return True
+
+
+def move(source, target):
+    """
+    Rename source to target without overwriting an existing file.
+
+    Across filesystems, the file is copied (with its timestamps) and the
+    original removed.
+    """
+    try:
+        place(source, target)
+    except OSError as error:
+        if error.errno != errno.EXDEV:
+            raise
+        copy_file(source, target)
+        shutil.copystat(source, target)
+        os.unlink(source)
+
+
+def rename(record, filename, copy=False, hardlink=False, target=None):
+    """
+    Rename the PDF filename after record, or copy it if copy is True (as a
+    hard link, if hardlink is True).
+
+    The new file is put into the directory of filename, or at target (e.g.
+    from a RenamePlan) if given. An existing file is never overwritten.
+    Returns the new path.
+    """
+    target = target or new_filename(filename, record)
+    if copy:
+        copy_file(filename, target, hardlink)
+    else:
+        move(filename, target)
+    return target
+
+
+def matches(name, patterns):
+    """Return True if the file name matches one of the glob patterns."""
+    return any(fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def find_pdfs(paths, patterns, recursive=True):
+    """
+    Yield the files named in paths, expanding directories.
+
+    Files given explicitly are always yielded. Directories are searched
+    (recursively, unless recursive is False) for files whose name matches
+    one of the glob patterns, in sorted order.
+    """
+    for path in paths:
+        if not os.path.isdir(path):
+            yield path
+            continue
+        for root, dirs, files in os.walk(path):
+            if recursive:
+                dirs.sort()
+            else:
+                dirs[:] = []
+            for name in sorted(files):
+                if matches(name, patterns):
+                    yield os.path.join(root, name)
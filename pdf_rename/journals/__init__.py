@@ -0,0 +1,349 @@
+"""
+Journal detection and the registry of the parsers for the supported
+journals.
+
+Each parser takes the document information dictionary, the subject line
+identifying the journal, the lines of the first page (if they were needed
+for finding the subject, else None), the PageText of the document, and
+the title and author from the document information (or "" and None), and
+returns the record fields it found.
+
+The parsers live in the modules of this package, one per journal, which
+are only imported when a file of their journal is parsed (see
+ParserRegistry). Other packages can add parsers through the entry point
+group pdf_rename.journals (see ParserRegistry.load_plugins).
+"""
+import importlib
+import importlib.metadata
+import importlib.util
+import re
+import warnings
+
+# Identify journals.
+journals = ['BEHAVIORAL AND BRAIN',
+            'Revue canadienne de linguistique',
+            'Cognitive Psychology',
+            'Frontiers in Psychology',
+            # Glossa post Janeway
+            r'Glossa: (| )a (| )journal (| )of (| )general (| )linguistics',
+            'J. Linguistics',
+            'Journal of Comparative Germanic Linguistics',
+            'J Comp German Linguistics',
+            'Journal ofGermanic Linguistics',
+            'Journal of Memory and Language',
+            'Journal of Language Modelling',
+            'languagesciencepress',
+            'Language Science Press',
+            'Berlin: Language',
+            'Language, Volume',
+            r'Lang Resources & Evaluation'
+            r'Language Sciences \d{1,2}',
+            r'Language & Communication',
+            'Lingua',
+            'Linguistic Inquiry',
+            'Linguistic Typology',
+            'Linguistics Vanguard',
+            r'Linguistics \d{1,4}',
+            r'Morphology \(\d{4}\)',
+            'Nat Lang Ling',
+            'Nat Lang Semantics',
+            'PNAS',
+            'Linguistic Review',
+            'Theoretical Linguistics',
+            'TO CITE THIS ARTICLE',     # newer Glossa
+            'Zeitschrift für Sprachwissenschaft'
+            ]
+
+
+# Fields of a record (see parse_file) that journal parsers can set.
+record_fields = ('authors', 'editors', 'year', 'title', 'journaltitle',
+                 'shortjournaltitle', 'volume', 'number', 'page_start',
+                 'page_end', 'doi', 'eid', 'entry_type', 'author_type',
+                 'booktitle', 'series', 'location', 'publisher', 'notes')
+
+
+def parser_fields(names):
+    """
+    Return the record fields among names, the local variables of a parser.
+
+    Journal parsers set whatever fields they find as local variables and
+    return parser_fields(locals()); fields they do not set keep their
+    defaults.
+    """
+    return {name: value for name, value in names.items()
+            if name in record_fields}
+
+
+# Entry point group of plugins: each entry point is a function that is
+# called with the ParserRegistry to register the plugin's parsers.
+ENTRY_POINT_GROUP = 'pdf_rename.journals'
+
+
+class ParserRegistry:
+    """
+    Journal parsers by key, with the signature (a pattern) identifying the
+    journal in the subject line (from the metadata or the first page).
+
+    A parser is registered with the name of its function, 'module:function'
+    (relative to this package if module starts with a dot), and its module
+    is only imported when the parser is first used. Registering a key again
+    replaces its parser. journals, info_parsers and xmp_journals are those
+    of the module, extended by plugins.
+    """
+
+    def __init__(self, journals, info_parsers, xmp_journals):
+        self.journals = journals
+        self.info_parsers = info_parsers
+        self.xmp_journals = xmp_journals
+        self.parsers = []
+        self.functions = {}
+        self.plugins_loaded = False
+        self.plugins = []
+        self._journal_re = None
+        self._parser_re = None
+
+    def register(self, key, pattern, target, journal=None, info=False):
+        """
+        Register the parser function target for key (an identifier), used
+        for subjects matching pattern.
+
+        journal is a pattern matching the line that names the journal on
+        the first page, if the journals do not match it already; with info
+        true, the parser is tried on the document information first (see
+        info_parsers).
+
+        Raises ValueError if key is not an identifier, if pattern or
+        journal is not a valid pattern, or if their group names clash with
+        those of other parsers, which would break the patterns of all
+        journals.
+        """
+        if not key.isidentifier():
+            raise ValueError('parser key is not an identifier: ' + key)
+        try:
+            groups = set(re.compile(pattern).groupindex)
+            if journal:
+                re.compile(journal)
+        except re.error as error:
+            raise ValueError('invalid pattern for ' + key + ': ' +
+                             str(error))
+        if key in groups:
+            raise ValueError('pattern for ' + key + ' has a group ' + key)
+        for other, other_pattern, _ in self.parsers:
+            names = set(re.compile(other_pattern).groupindex) | {other}
+            if other != key and (key in names or groups & names):
+                raise ValueError('group names of ' + key + ' clash with ' +
+                                 other)
+        parser = (key, pattern, target)
+        keys = [other for other, _, _ in self.parsers]
+        if key in keys:
+            self.parsers[keys.index(key)] = parser
+        else:
+            self.parsers.append(parser)
+        self.functions.pop(key, None)
+        if journal and journal not in self.journals:
+            self.journals.append(journal)
+        if info:
+            self.info_parsers.add(key)
+        self._journal_re = None
+        self._parser_re = None
+
+    def load_plugins(self):
+        """
+        Let the plugins installed for ENTRY_POINT_GROUP register their
+        parsers, once. Plugins that fail to load are skipped with a warning.
+        """
+        if self.plugins_loaded:
+            return
+        self.plugins_loaded = True
+        try:
+            entry_points = importlib.metadata.entry_points(
+                group=ENTRY_POINT_GROUP)
+        except TypeError:  # Python < 3.10
+            entry_points = importlib.metadata.entry_points().get(
+                ENTRY_POINT_GROUP, [])
+        for entry_point in entry_points:
+            dist = getattr(entry_point, 'dist', None)
+            self.plugins.append((entry_point.name, dist and dist.version))
+            try:
+                entry_point.load()(self)
+            except Exception as error:
+                warnings.warn("Cannot load journal plugin " +
+                              entry_point.name + ": " + str(error))
+
+    # All journal lines and parser signatures are compiled into one pattern
+    # each, so that a line is checked against all journals in a single
+    # search.
+
+    @property
+    def journal_re(self):
+        """The pattern matching any of the journals."""
+        self.load_plugins()
+        if self._journal_re is None:
+            self._journal_re = re.compile('|'.join(
+                '(?:' + journal + ')' for journal in self.journals))
+        return self._journal_re
+
+    @property
+    def parser_re(self):
+        """The pattern matching any signature, with a group per key."""
+        self.load_plugins()
+        if self._parser_re is None:
+            self._parser_re = re.compile('|'.join(
+                '(?P<' + key + '>' + pattern + ')'
+                for key, pattern, _ in self.parsers))
+        return self._parser_re
+
+    def function(self, key):
+        """Return the parser function for key, importing its module."""
+        if key not in self.functions:
+            self.load_plugins()
+            target = dict((other, target)
+                          for other, _, target in self.parsers)[key]
+            module, _, name = target.partition(':')
+            module = importlib.import_module(module, __name__)
+            self.functions[key] = getattr(module, name)
+        return self.functions[key]
+
+    def source(self, key):
+        """
+        Return the source of the module of the parser for key, read
+        without importing it (b'' if it cannot be found).
+        """
+        target = dict((other, target)
+                      for other, _, target in self.parsers)[key]
+        try:
+            spec = importlib.util.find_spec(target.partition(':')[0],
+                                            __name__)
+            with open(spec.origin, 'rb') as f:
+                return f.read()
+        except (AttributeError, ImportError, OSError, TypeError,
+                ValueError):
+            return b''
+
+    def signature(self):
+        """
+        Return a description of everything that determines what the parsers
+        extract: the journals, the parsers with their signatures and the
+        sources of their modules, info_parsers, xmp_journals and the
+        versions of the plugins.
+        """
+        self.load_plugins()
+        sources = [self.source(key) for key, _, _ in self.parsers]
+        return repr((self.journals, self.parsers, sources,
+                     sorted(self.info_parsers),
+                     sorted(self.xmp_journals.items()), self.plugins))
+
+    def find(self, subject, title=''):
+        """
+        Return the key of the parser for the journal identified in subject.
+
+        Returns None if no parser matches. Of several signatures matching
+        subject, the one matching earliest in subject wins. The key is that
+        of the group around the matching signature, not lastgroup, which
+        may be a group inside it.
+        """
+        if title == "Linguistics Vanguard":
+            return 'vanguard'
+        match = self.parser_re.search(subject)
+        if match is None:
+            return None
+        groups = match.groupdict()
+        return next(key for key, _, _ in self.parsers
+                    if groups[key] is not None)
+
+
+# The built-in journal parsers, with the signature identifying the journal
+# in the subject line. The parser for key is parse_<key> in the module
+# <key> of this package.
+builtin_parsers = [
+    ('jstor', r'^JSTOR$'),
+    ('annual_review', r'Annu\. Rev\. Linguist'),
+    ('bbs', 'BEHAVIORAL AND BRAIN'),
+    ('cjl', 'Revue canadienne de linguistique'),
+    ('cognition', 'Cognition'),
+    ('cognitive_psychology', 'Cognitive Psychology'),
+    ('cognitive_science', 'Cognitive Science'),
+    ('jcgl', 'Comparative Germanic Linguistics|J Comp German Linguistics'),
+    ('frontiers', 'Frontiers in Psychology'),
+    ('jol', r'J\. Linguistics|(?<!Canadian )Journal of Linguistics'),
+    ('jgl', 'Journal ofGermanic Linguistics'),
+    ('glossa', 'Glossa'),
+    ('glossa_citation', 'TO CITE THIS ARTICLE'),
+    ('jlm', 'Journal of Language Modelling'),
+    ('jml', 'Journal of Memory and Language'),
+    ('lsp_book', 'languagesciencepress'),
+    ('lsp_chapter', 'Language Science Press|Berlin: Language'),
+    ('language', 'Language, Volume'),
+    ('llc', 'Language and Linguistics Compass'),
+    ('lre', 'Lang.+? Resources'),
+    ('language_sciences', 'Language Sciences|Language & Communication'),
+    ('lingua', 'Lingua'),
+    ('li', 'Linguistic Inquiry'),
+    ('typology_old', r'Linguistic Typology \d{1,2};'),
+    ('typology', r'Linguistic Typology 2\d{3};'),
+    ('linguistics', r'(?<!Theoretical )Linguistics \d{1,4}(?: |;|–)'),
+    ('vanguard', 'Linguistics Vanguard'),
+    ('morphology', r'Morphology \(\d{4}\)'),
+    ('nllt', 'Nat Lang Ling'),
+    ('nls', 'Nat Lang Semantics'),
+    ('pnas', 'PNAS'),
+    ('syntax', 'Syntax'),
+    ('tlr', 'Linguistic Review'),
+    ('theoretical_linguistics', 'Theoretical Linguistics'),
+    ('zs', 'Zeitschrift für Sprachwissenschaft'),
+    ]
+
+
+# Parsers that can take everything from the document information (the
+# citation in the Subject, Title and Author), without the text of the
+# first page. They are tried first, with journalinfo and page_text None.
+info_parsers = {'glossa', 'jml', 'language_sciences'}
+
+
+# Journals whose publishers (Elsevier, Springer, De Gruyter) write complete
+# XMP metadata, by the lowercased prism:publicationName, with the parser
+# key and the journal titles used by the parser.
+xmp_journals = {
+    'cognition': ('cognition', "Cognition", "Cognition"),
+    'cognitive psychology': ('cognitive_psychology', "Cognitive Psychology",
+                             "Cognitive Psychology"),
+    'journal of memory and language': ('jml',
+                                       "Journal of Memory and Language",
+                                       "J Mem Lang"),
+    'language sciences': ('language_sciences', "Language Sciences",
+                          "Lang Sci"),
+    'lingua': ('lingua', "Lingua", "Lingua"),
+    'the journal of comparative germanic linguistics': (
+        'jcgl', "The Journal of Comparative Germanic Linguistics", "JCGL"),
+    'journal of comparative germanic linguistics': (
+        'jcgl', "The Journal of Comparative Germanic Linguistics", "JCGL"),
+    'language resources and evaluation': (
+        'lre', "Language Resources and Evaluation",
+        "Lang Resources & Evaluation"),
+    'morphology': ('morphology', "Morphology", "Morphol"),
+    'natural language & linguistic theory': (
+        'nllt', r"Natural Language \& Linguistic Theory", "NLLT"),
+    'natural language semantics': ('nls', "Natural Language Semantics",
+                                   "Nat Lang Semantics"),
+    'linguistics': ('linguistics', "Linguistics", "Linguistics"),
+    'linguistics vanguard': ('vanguard', "Linguistics Vanguard",
+                             "Linguistics Vanguard"),
+    'linguistic typology': ('typology', "Linguistic Typology",
+                            "Linguist Typol"),
+    'the linguistic review': ('tlr', "The Linguistic Review",
+                              "Linguist Rev"),
+    'theoretical linguistics': ('theoretical_linguistics',
+                                "Theoretical Linguistics", "Theor Linguist"),
+    'zeitschrift für sprachwissenschaft': (
+        'zs', "Zeitschrift für Sprachwissenschaft",
+        "Zeitschrift für Sprachwissenschaft"),
+}
+
+
+registry = ParserRegistry(journals, info_parsers, xmp_journals)
+for key, pattern in builtin_parsers:
+    registry.register(key, pattern, '.' + key + ':parse_' + key)
+
+
+parsers = registry.parsers
+find_parser = registry.find
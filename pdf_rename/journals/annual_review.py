@@ -0,0 +1,23 @@
+"""Parser for Annual Review of Linguistics."""
+import re
+
+from ..text import get_doi_from_text
+from . import parser_fields
+
+
+def parse_annual_review(info, subject, journalinfo, page_text, title, author):
+    """Annual Review of Linguistics."""
+    notes = ["Please doublecheck DOI."]
+    journaltitle = "Annual Review of Linguistics"
+    shortjournaltitle = "Annu Rev Linguist"
+    journalinfo = page_text.lines()[:55]
+    values = re.search(r'Annu. Rev. Linguist. (\d{4}).(\d{1}):(.+?)-(.*)',
+                       subject)
+    year = values.group(1)
+    volume = values.group(2)
+    number = ""
+    page_start, page_end = values.group(3), values.group(4)
+    authors = author.split(' and ')
+    doi = get_doi_from_text(journalinfo, notes)
+    eid = ""
+    return parser_fields(locals())
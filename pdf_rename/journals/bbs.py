@@ -0,0 +1,43 @@
+"""Parser for Behavioral and Brain Sciences."""
+import re
+
+from ..text import get_doi_from_text, get_index, tag_empty_items
+from . import parser_fields
+
+
+def parse_bbs(info, subject, journalinfo, page_text, title, author):
+    """Behavioral and Brain Sciences."""
+    notes = []
+    journaltitle = "Behavioral and Brain Sciences"
+    shortjournaltitle = "Behav. Brain Sci."
+    if 'Page' in journalinfo[0]:
+        values = re.search(r'BEHAVIORAL AND BRAIN SCIENCES \((\d{4})\), ' +
+                           r'Page (\d{1}) of (\d{1,3})', journalinfo[0])
+        page_start = values.group(2)
+        page_end = values.group(3)
+        eid = re.search(r'doi:.+?e(\d{1,3})', journalinfo[1]).group(1)
+    else:
+        values = re.search(r'BEHAVIORAL AND BRAIN SCIENCES \((\d{4})\) ' +
+                           r'(\d{1,2}), (\d{1,3}) –(\d{1,3})', journalinfo[0])
+        page_start = values.group(3)
+        page_end = values.group(4)
+        eid = ""
+    year = values.group(1)
+    volume = str(int(year)-1977)
+    number = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    # Empty strings ('') are replaced by subsequent numbers starting
+    # from 1 by tag_empty_strings.
+    #
+    # The title is then the list of strings from the index of '1'+1 to the
+    # index of '2'; the list of authors starts at that '2'+1 and goes on to n+1
+    # where n is the final original empty string before the field containing
+    # the string 'Abstract:'.
+    tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[journalinfo.index('1')+1:
+                     journalinfo.index('2')])
+    authors = []
+    author_end = int(journalinfo[get_index('Abstract:', journalinfo)-1])
+    for n in range(2, author_end):
+        authors.append(journalinfo[journalinfo.index(str(n))+1])
+    return parser_fields(locals())
@@ -0,0 +1,26 @@
+"""
+Parser for Canadian Journal of Linguistics/Revue canadienne de
+linguistique.
+"""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_cjl(info, subject, journalinfo, page_text, title, author):
+    """Canadian Journal of Linguistics/Revue canadienne de linguistique."""
+    notes = []
+    journaltitle = "Canadian Journal of Linguistics/Revue canadienne de linguistique"
+    shortjournaltitle = "Can J Ling/Rev Can L"
+    values = re.search(', (\d{1,2})\((\d{1,2})\): (\d{1,4})–(\d{1,4}), (\d{4})',
+                       journalinfo[0])
+    year, volume, number = values.group(5), values.group(1), values.group(2)
+    page_start = values.group(3)
+    page_end = values.group(4)
+    authors = [item.lower() for item in journalinfo[:10] if item.isupper()]
+    doi = get_doi_from_text(journalinfo, notes)
+    journalinfo = tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[journalinfo.index('1')+1:journalinfo.index('2')])
+    eid = ""
+    return parser_fields(locals())
@@ -0,0 +1,31 @@
+"""Parser for Cognition."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_cognition(info, subject, journalinfo, page_text, title, author):
+    """Cognition."""
+    notes = []
+    journalinfo = page_text.lines()
+    journaltitle = "Cognition"
+    shortjournaltitle = "Cognition"
+    values = re.search(r'Cognition, (\d{1,3}) \((\d{4})\) (\d{1,6})',
+                       info['Subject'].decode('UTF-8'))
+    volume = values.group(1)
+    number = ""
+    year = values.group(2)
+    page_start = "1"
+    page_end = ""
+    eid = values.group(3)
+    doi = get_doi_from_text(journalinfo, notes)
+    tag_empty_items(journalinfo)
+    title = journalinfo[journalinfo.index('4')+1]
+    author_start = int(journalinfo.index('5')-1)
+    author_end = int(journalinfo.index('6')-1)
+    if author is None:
+        author = re.sub(r'(\*)|(\d)|( [a-z],)', '',
+                        journalinfo[author_start] + journalinfo[author_end])
+    authors = author.split(', ')
+    return parser_fields(locals())
@@ -0,0 +1,31 @@
+"""Parser for Cognitive Psychology."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_cognitive_psychology(info, subject, journalinfo, page_text, title,
+                               author):
+    """Cognitive Psychology."""
+    notes = []
+    journalinfo = page_text.lines()
+    journaltitle = "Cognitive Psychology"
+    shortjournaltitle = "Cognitive Psychology"
+    values = re.search(r'Cognitive Psychology (\d{1,3}) \((\d{4})\) ' +
+                       r'(\d{1,3})–(\d{1,3})',
+                       journalinfo[0])
+    volume = values.group(1)
+    number = ""
+    year = values.group(2)
+    page_start = values.group(3)
+    page_end = values.group(4)
+    eid = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[journalinfo.index('4')+1:
+                                 journalinfo.index('5')])
+    author = ' '.join(journalinfo[journalinfo.index('5')+1:
+                                  journalinfo.index('6')])
+    authors = author.split(', ')
+    return parser_fields(locals())
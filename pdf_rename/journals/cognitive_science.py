@@ -0,0 +1,39 @@
+"""Parser for Cognitive Science."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_cognitive_science(info, subject, journalinfo, page_text, title,
+                            author):
+    """Cognitive Science."""
+    notes = []
+    journalinfo = page_text.lines()
+    journaltitle = "Cognitive Science"
+    shortjournaltitle = "Cognitive Science"
+    values = re.search(r'Cognitive Science (\d{1,4}).(\d{1,2}):' +
+                       r'((\d{1,4}-\d{1,4})|e.*)',
+                       info['Subject'].decode('UTF-8'))
+    year = values.group(1)
+    volume = values.group(2)
+    number = ""
+    if 'e' in values.group(3):
+        eid = values.group(3)
+        page_start = "1"
+        page_end = ""
+    else:
+        page_start = values.group(3)
+        page_end = values.group(4)
+        eid = ""
+    if info['WPS-ARTICLEDOI'] != "":
+        doi = info['WPS-ARTICLEDOI'].decode('UTF-8')
+    else:
+        doi = get_doi_from_text(journalinfo, notes)
+    tag_empty_items(journalinfo)
+    author = journalinfo[journalinfo.index('2')+1]
+    author = re.sub(r',\w', ',', author)
+    author = re.sub('u¨', 'ü', author)
+    author = re.sub('o¨', 'ö', author)
+    authors = author.split(', ')
+    return parser_fields(locals())
@@ -0,0 +1,31 @@
+"""Parser for Frontiers in Psychology."""
+import re
+
+from ..text import get_doi_from_text, get_index, tag_empty_items
+from . import parser_fields
+
+
+def parse_frontiers(info, subject, journalinfo, page_text, title, author):
+    """Frontiers in Psychology."""
+    notes = []
+    journaltitle = "Frontiers in Psychology"
+    shortjournaltitle = "Front Psychol"
+    doi = get_doi_from_text(journalinfo, notes)
+    journalinfo = journalinfo[get_index('ORIGINAL RESEARCH', journalinfo):]
+    journalinfo = tag_empty_items(journalinfo)
+    authors = ' '.join(journalinfo[journalinfo.index('2')+1:
+                                   journalinfo.index('3')])  # .split(' and ')
+    authors = re.sub(r'\*', '', authors)
+    authors = re.sub(r'\d', '', authors)
+    authors = re.sub(', ', ' and ', authors)
+    authors = authors.split(' and ')
+    citation = ' '.join(journalinfo[journalinfo.index('Citation:')+1:
+                                    get_index("Frontiers in Psychology |",
+                                              journalinfo)-1])
+    year = re.search(r'\((\d{4})\)', citation).group(1)
+    volume = re.search(r'(\d{1,3}):', citation).group(1)
+    eid = re.search(r'\.(\d+?)$', doi).group(1)
+    number = ""
+    page_start = "1"
+    page_end = ""
+    return parser_fields(locals())
@@ -0,0 +1,51 @@
+"""Parser for Glossa (with the citation in the Subject or on page 1)."""
+import re
+
+from ..text import get_doi_from_text, get_index
+from . import parser_fields
+
+
+def parse_glossa(info, subject, journalinfo, page_text, title, author):
+    """Glossa (with the citation in the Subject or on page 1)."""
+    notes = []
+    journaltitle = "Glossa: a journal of general linguistics"
+    shortjournaltitle = "Glossa"
+    if "DOI" in subject:  # ugly hack!
+        year = re.search(r'\d{4}', subject).group(0)
+        glossa = re.search(r'([A-Za-z].*) (\d)\((\d{1,2})\): ' +
+                           r'(\d{1,2}).+?(\d)-(\d{1,2}).+?(\d.*)',
+                           subject)
+        volume = glossa.group(2)
+        number = glossa.group(3)
+        eid = glossa.group(4)
+        page_start = glossa.group(5)
+        page_end = glossa.group(6)
+        doi = glossa.group(7)
+        authors = author.split(' and ')
+    else:
+        docinfo = page_text.lines()
+        get_index('DOI: ', docinfo)
+        titledata = ''.join(docinfo[4:get_index('DOI: ', docinfo)+2])
+        title = re.search(r'\d{4}. (.+?) Glossa',
+                          titledata).group(1).rstrip(r'\.')
+        year = re.search(r'\. (\d{4})', titledata).group(1)
+        data = re.search(r'(\d{1,2})\(1\):.+?(\d{1,3}), ' +
+                         r'pp\. (\d{1})–(\d{1,3})', titledata)
+        data = re.search(r'(\d)\((\d{1,2})\): ' +
+                         r'(\d{1,3}). ' +
+                         r'(\d).(\d{1,3})',
+                         titledata)
+        volume = data.group(1)
+        number = "1"
+        eid = data.group(3)
+        page_start = data.group(4)
+        page_end = data.group(5)
+        doi = get_doi_from_text(titledata.split('DOI: '), notes)
+        author = docinfo[get_index('@', docinfo)-3]
+        if "&" in author:
+            authors = author.split(' & ')
+        elif "and" in author:
+            authors = author.split(' and ')
+        else:
+            authors = author
+    return parser_fields(locals())
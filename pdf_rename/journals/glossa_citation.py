@@ -0,0 +1,29 @@
+"""Parser for Glossa (newer layout with a 'TO CITE THIS ARTICLE' block)."""
+import re
+
+from . import parser_fields
+
+
+def parse_glossa_citation(info, subject, journalinfo, page_text, title,
+                          author):
+    """Glossa (newer layout with a 'TO CITE THIS ARTICLE' block)."""
+    journaltitle = "Glossa: a journal of general linguistics"
+    shortjournaltitle = "Glossa"
+    journalinfo = journalinfo[journalinfo.index('TO CITE THIS ARTICLE:'):]
+    journalinfo = ''.join(journalinfo[1:journalinfo.index('')])
+    # Lau, Elaine and Nozomi Tanaka. 2021. The subject advantage in relative
+    # clauses: A review. Glossa: a journal of general linguistics 6(1): 34.
+    # 1–34. DOI:
+    glossa = re.search(r'([A-Za-z].*). (\d{4}). (.+?). ' +
+                       'Glossa: a journal of general linguistics ' +
+                       r'(\d{1,2})\((\d{1})\): (\d{1,3}). (\d{1})–(\d{1,3}).' +
+                       ' DOI: https://doi.org/(.*)', journalinfo)
+    author = glossa.group(1)
+    year = glossa.group(2)
+    title = glossa.group(3)
+    volume, number = glossa.group(4), glossa.group(5)
+    eid = glossa.group(6)
+    page_start, page_end = glossa.group(7), glossa.group(8)
+    doi = glossa.group(9)
+    authors = author.split(' and ')
+    return parser_fields(locals())
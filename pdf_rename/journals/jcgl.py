@@ -0,0 +1,47 @@
+"""Parser for The Journal of Comparative Germanic Linguistics."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_jcgl(info, subject, journalinfo, page_text, title, author):
+    """The Journal of Comparative Germanic Linguistics."""
+    notes = []
+    journaltitle = "The Journal of Comparative Germanic Linguistics"
+    shortjournaltitle = "JCGL"
+    # shortjournaltitle = "J Comp German Linguist"
+    values = re.search('Journal of Comparative Germanic Linguistics ' +
+                       r'(\d{1,3}): (\d{1,4})–(\d{1,4}), (\d{4})',
+                       subject)
+    if values is None:
+        journalinfo = page_text.lines()
+        subject = [line for line in journalinfo if 'Comp German' in line][0]
+        values = re.search('J Comp German Linguistics ' +
+                           r'\((\d{4})\) (\d{1,3}):(\d{1,4})–(\d{1,4})',
+                           subject)
+        volume = values.group(2)
+        number = ""
+        year = values.group(1)
+        page_start = values.group(3)
+        page_end = values.group(4)
+        journalinfo = tag_empty_items(journalinfo)
+        title = ' '.join(journalinfo[journalinfo.index('2')+1:journalinfo.index('3')])
+        author = journalinfo[journalinfo.index('3')+1]
+    else:
+        volume = values.group(1)
+        number = ""
+        year = values.group(4)
+        page_start = values.group(2)
+        page_end = values.group(3)
+    eid = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    if author is None:
+        author = ""
+    elif author == "":
+        author = re.sub(r'\d', '', journalinfo[11])
+    else:
+        author = re.sub('ˇc', 'č', author)
+        author = re.sub('1$', '', author)
+    authors = author.split(' and ')
+    return parser_fields(locals())
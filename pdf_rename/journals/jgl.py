@@ -0,0 +1,23 @@
+"""Parser for Journal of Germanic Linguistics."""
+import re
+
+from . import parser_fields
+
+
+def parse_jgl(info, subject, journalinfo, page_text, title, author):
+    """Journal of Germanic Linguistics."""
+    journaltitle = "Journal of Germanic Linguistics"
+    shortjournaltitle = "Journal of Germanic Linguistics"
+    values = re.search('Journal ofGermanic Linguistics ' +
+                       r'(\d{1,3}).(\d{1}) \((\d{4})\):(\d{1,4})-(\d{1,4})',
+                       subject)
+    volume = values.group(1)
+    number = values.group(2)
+    year = values.group(3)
+    page_start = values.group(4)
+    page_end = values.group(5)
+    eid = ""
+    doi = ""    # get_doi_from_text(journalinfo)
+    title = journalinfo[journalinfo.index('')+1].strip(' ')
+    authors = author.split(' and ')
+    return parser_fields(locals())
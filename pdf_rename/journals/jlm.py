@@ -0,0 +1,21 @@
+"""Parser for Journal of Language Modelling."""
+import re
+
+from . import parser_fields
+
+
+def parse_jlm(info, subject, journalinfo, page_text, title, author):
+    """Journal of Language Modelling."""
+    journaltitle = "Journal of Language Modelling"
+    shortjournaltitle = "Journal of Language Modelling"
+    values = re.search(r'Journal of Language Modelling Vol (\d{1,2}), ' +
+                       r'No (\d{1}) \((\d{4})\), pp. (\d{1,3})–(\d{1,3})',
+                       subject)
+    volume, number, year = values.group(1), values.group(2), values.group(3)
+    page_start, page_end = values.group(4), values.group(5)
+    title = ' '.join(journalinfo[:journalinfo.index('')])
+    author = re.sub(r'\d', '', journalinfo[journalinfo.index('')+1])
+    authors = author.split(' and ')
+    doi = ""
+    eid = ""
+    return parser_fields(locals())
@@ -0,0 +1,24 @@
+"""Parser for Journal of Memory and Language."""
+import re
+
+from . import parser_fields
+
+
+def parse_jml(info, subject, journalinfo, page_text, title, author):
+    """Journal of Memory and Language."""
+    journaltitle = "Journal of Memory and Language"
+    shortjournaltitle = "J Mem Lang"
+    values = re.search(r'Journal of Memory and Language(|,) ' +
+                       r'(\d{1,3}) \((\d{4})\) (\d{1,4})(-|–)(\d{1,4})',
+                       subject)
+    volume = values.group(2)
+    number = ""
+    year = values.group(3)
+    page_start = values.group(4)
+    page_end = values.group(6)
+    doi = re.search('(10.+?)( |$|,)', subject).group(0)
+    eid = ""
+    title = info['Title'].decode('UTF-8')
+    author = info['Author'].decode('UTF-8')
+    authors = author.split(', ')
+    return parser_fields(locals())
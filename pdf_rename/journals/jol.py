@@ -0,0 +1,48 @@
+"""Parser for Journal of Linguistics."""
+import re
+
+from ..text import first_index, get_doi_from_text
+from . import journals, parser_fields
+
+
+def unspace(name):
+    """
+    Return name with letter-spacing ('J A N E  D O E') undone, keeping the
+    spaces between words.
+    """
+    if all(len(word) == 1 for word in name.split()):
+        return ' '.join(word.replace(' ', '')
+                        for word in re.split(' {2,}', name.strip()))
+    return ' '.join(name.split())
+
+
+def parse_jol(info, subject, journalinfo, page_text, title, author):
+    """Journal of Linguistics."""
+    notes = []
+    journaltitle = "Journal of Linguistics"
+    shortjournaltitle = "JoL"
+    journalinfo = page_text.lines()
+    subject = journalinfo[first_index(
+        journalinfo,
+        lambda line: any(journal in line for journal in journals))]
+    values = re.search('J. Linguistics ' +
+                       r'(\d{1,2}) \((\d{4})\), (\d{1,4}).(\d{1,4})',
+                       subject)
+    volume = values.group(1)
+    number = ""
+    year = values.group(2)
+    page_start = values.group(3)
+    page_end = values.group(4)
+    doi = get_doi_from_text(journalinfo, notes)
+    # title starts after a newline
+    title_start = journalinfo[journalinfo.index('')+1]
+    # title ends before the first author's name in upper case
+    title_end = journalinfo[first_index(journalinfo[:15], str.isupper)-1]
+    if title_start != title_end:
+        title = re.sub(r'\d$', '', title_start + ' ' + title_end)
+    else:
+        title = re.sub(r'\d$', '', title_start)
+    authors = [unspace(author).title() for author in journalinfo[:15]
+               if author.isupper()]
+    eid = ""
+    return parser_fields(locals())
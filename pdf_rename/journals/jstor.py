@@ -0,0 +1,50 @@
+"""Parser for JSTOR cover pages (journal details after 'Source:')."""
+import re
+
+from ..text import first_index, get_doi_from_text, get_index
+from . import parser_fields
+
+
+def parse_jstor(info, subject, journalinfo, page_text, title, author):
+    """JSTOR cover pages (journal details after 'Source:')."""
+    notes = []
+    values_one = re.search(r'Source: (.+?),.+?Vol. (\d{1,2})',
+                           journalinfo[get_index('Source: ', journalinfo)])
+    journaltitle = values_one.group(1)
+    if journaltitle == "Linguistic Inquiry":
+        shortjournaltitle = "LI"
+    elif journaltitle == "Natural Language & Linguistic Theory":
+        journaltitle = r"Natural Language \& Linguistic Theory"
+        shortjournaltitle = "NLLT"
+    elif journaltitle == "Language":
+        shortjournaltitle = "Lg"
+    else:
+        shortjournaltitle = journaltitle
+    volume = values_one.group(2)
+    author_field_index = first_index(journalinfo,
+                                     lambda x: 'Author(s): ' in x or
+                                     'Review by: ' in x)
+    if 'Review: ' in journalinfo[0]:
+        title = journalinfo[author_field_index-2].strip(r' \$').lstrip('Review: ')
+    else:
+        title = journalinfo[author_field_index-1].strip(r' \$')
+    author = journalinfo[author_field_index].lstrip('(Author(s):\|Review by:)').lstrip(' ')
+    # identify items containing "Source: ..." and "Publisher: ..."
+    journalinfo = ' '.join(journalinfo[get_index('Source:', journalinfo):
+                                       get_index('Source:', journalinfo)+1])
+    values_two = re.search(r'No. (\d{1}).+?(\d{4}).+?pp.+?(\d{1,4})-(\d{1,4})',
+                           journalinfo)
+    if isinstance(values_two, re.Match):
+        number = values_two.group(1)
+        year = values_two.group(2)
+        page_start = values_two.group(3)
+        page_end = values_two.group(4)
+    else:
+        number = ""
+        year = ""
+        page_start = ""
+        page_end = ""
+    authors = author.split(' and ')
+    doi = get_doi_from_text(journalinfo, notes)
+    eid = ""
+    return parser_fields(locals())
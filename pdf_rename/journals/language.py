@@ -0,0 +1,33 @@
+"""Parser for Language (with a Project Muse title page)."""
+import re
+
+from ..text import get_doi_from_text
+from . import parser_fields
+
+
+def parse_language(info, subject, journalinfo, page_text, title, author):
+    """Language (with a Project Muse title page)."""
+    notes = []
+    journaltitle = "Language"
+    shortjournaltitle = "Lg"
+    lg_info = journalinfo[:10]
+    values = re.search(r'.+? Volume (\d{1,3}), Number (\d{1}), ' +
+                       r'.+? (\d{4}), pp. (e|)(\d{1,4})-(e|)(\d{1,4})',
+                       subject)
+    volume, number, year = values.group(1), values.group(2), values.group(3)
+    page_start = values.group(4)+values.group(5)
+    page_end = values.group(6)+values.group(7)
+    doi = get_doi_from_text(lg_info, notes)
+    eid = ""
+    if 'þÿ' in title:
+        title_list = title.split('þÿ')[1].split('\x00')
+        title = ''
+        for char in title_list:
+            title = title + char
+    if 'þÿ' in author:
+        author_list = author.split('þÿ')[1].split('\x00')
+        author = ''
+        for char in author_list:
+            author = author + char
+    authors = author.split(', ')
+    return parser_fields(locals())
@@ -0,0 +1,29 @@
+"""Parser for Language Sciences (and Language & Communication)."""
+import re
+
+from . import parser_fields
+
+
+def parse_language_sciences(info, subject, journalinfo, page_text, title,
+                            author):
+    """Language Sciences (and Language & Communication)."""
+    journaltitle = "Language Sciences"
+    shortjournaltitle = "Lang Sci"
+    # values = re.search('Lingua ' +
+    #                   r'(\d{1,3}) \((\d{4})\) (\d{1,4})–(\d{1,4})',
+    #                   journalinfo[0])
+    values = re.search(r'Language (Sciences|& Communication)(|,) ' +
+                       r'(\d{1,3}) \((\d{4})\) (\d{1,4})(-|–)(\d{1,4})',
+                       subject)
+    volume = values.group(3)
+    number = ""
+    year = values.group(4)
+    page_start = values.group(5)
+    page_end = values.group(7)
+    doi = re.search('(10.+?)( |$|,)', subject).group(0)
+    eid = ""
+    title = info['Title'].decode('UTF-8')
+    # author = re.sub('(\*)|(\d)', '', journalinfo[6])
+    author = info['Author'].decode('UTF-8')
+    authors = author.split(', ')
+    return parser_fields(locals())
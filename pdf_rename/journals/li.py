@@ -0,0 +1,52 @@
+"""Parser for Linguistic Inquiry."""
+import re
+
+from ..text import get_doi_from_text, get_index, tag_empty_items
+from . import parser_fields
+
+
+def parse_li(info, subject, journalinfo, page_text, title, author):
+    """Linguistic Inquiry."""
+    notes = []
+    # LI is messy: we're looking directly at the text of the first page,
+    # reading it in as a list of strings.
+    li_text = page_text.lines()
+    li_info = li_text[0:10] + li_text[-9:-2]
+    # Get the item which includes "Linguistic Inquiry"
+    info = li_text[get_index('Linguistic Inquiry', li_text)]
+    journaltitle = "Linguistic Inquiry"
+    shortjournaltitle = "LI"
+    if "Early Access" in info:
+        values = ""
+        pages = li_text[get_index('–', li_text)]
+        page_start = re.search(r'(\d{1,3})–', pages).group(1)
+        page_end = re.search(r'–(\d{1,3})', pages).group(1)
+        year = re.search('(\d{4})', li_text[get_index('Massachusetts', li_text)]).group(0)
+        volume = ""
+        number = ""
+    else:
+        values = re.search(r'.+?(\d{1,2}).+?(\d{1,2}).+?(\d{4})', info)
+        volume = values.group(1)
+        number = values.group(2)
+        year = values.group(3)
+        # The page numbers are one item further than info
+        pages = li_text[get_index('Linguistic Inquiry', li_text)+1]
+        page_start = re.search(r'(\d{1,3})(–|-)(.*)', pages).group(1)
+        page_end = re.search(r'(\d{1,3})(–|-)(.*)', pages).group(3)
+    li_info = tag_empty_items(li_info)
+    if 'Remarks' in li_info[0]:
+        li_info = li_info[li_info.index('1')+1:]
+        title = ' '.join(li_info[li_info.index('1'):li_info.index('2')])
+        authors = li_info[:li_info.index('1')]
+    elif 'R E M A R K S' in li_info[0]:
+        title = ' '.join(li_info[li_info.index('2')+1:li_info.index('3')])
+        authors = li_info[li_info.index('3')+1:li_info.index('4')]
+    elif 'Early Access' in info:
+        authors = li_info[li_info.index('2')+1:li_info.index('3')]
+        title = ' '.join(li_info[li_info.index('1')+1:li_info.index('2')]).lower().capitalize()
+    else:
+        authors = li_info[li_info.index('1')+1:li_info.index('2')]
+        title = ' '.join(li_info[:li_info.index('1')])
+    doi = get_doi_from_text(li_text, notes)
+    eid = ""
+    return parser_fields(locals())
@@ -0,0 +1,31 @@
+"""Parser for Lingua."""
+import re
+
+from ..text import get_doi_from_text
+from . import parser_fields
+
+
+def parse_lingua(info, subject, journalinfo, page_text, title, author):
+    """Lingua."""
+    notes = []
+    journaltitle = "Lingua"
+    shortjournaltitle = "Lingua"
+    # values = re.search('Lingua ' +
+    #                   r'(\d{1,3}) \((\d{4})\) (\d{1,4})–(\d{1,4})',
+    #                   journalinfo[0])
+    values = re.search(r'Lingua(|,) ' +
+                       r'(\d{1,3}) \((\d{4})\) (\d{1,6})(-|–|)(\d{1,4}|)',
+                       subject)
+    volume = values.group(2)
+    number = ""
+    year = values.group(3)
+    page_start = values.group(4)
+    page_end = values.group(6)
+    lingua = page_text.lines()
+    doi = get_doi_from_text(lingua, notes)
+    eid = ""
+    title = info['Title'].decode('UTF-8')
+    # author = re.sub('(\*)|(\d)', '', journalinfo[6])
+    author = info['Author'].decode('UTF-8')
+    authors = author.split(', ')
+    return parser_fields(locals())
@@ -0,0 +1,46 @@
+"""Parser for Linguistics."""
+import re
+
+from ..names import split_string
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_linguistics(info, subject, journalinfo, page_text, title, author):
+    """Linguistics."""
+    notes = []
+    journaltitle = "Linguistics"
+    shortjournaltitle = "Linguistics"
+    values = re.search(r'Linguistics (\d{1,2})(–\d|) \((\d{4})\), ' +
+                       r'(\d{1,3})(-|–)(\d{1,3})', subject)
+    if values:
+        volume = values.group(1)
+        number = values.group(2).replace("–", "")
+        year = values.group(3)
+        page_start = values.group(4)
+        page_end = values.group(6)
+        doi = get_doi_from_text(journalinfo, notes)
+        eid = ""
+        tag_empty_items(journalinfo)
+        title = re.sub(r'\*', '', ' '.join(journalinfo[:journalinfo.index('1')]))
+        title = re.sub(r'1', '', ' '.join(journalinfo[:journalinfo.index('1')]))
+        author = journalinfo[journalinfo.index('1')+1:
+                             journalinfo.index('2')][0]
+        authors = split_string(author)
+    else:
+        values = re.search(r'Linguistics (\d{4}); (\d{1,2})\((\d{1})\):' +
+                           r' (\d{1,4})–(\d{1,4})', subject)
+        volume = values.group(2)
+        number = values.group(3)
+        year = values.group(1)
+        page_start = values.group(4)
+        page_end = values.group(5)
+        doi = get_doi_from_text(journalinfo, notes)
+        eid = ""
+        tag_empty_items(journalinfo)
+        title = re.sub(r'\*', '',
+                ' '.join(journalinfo[journalinfo.index('1')+2:journalinfo.index('2')]))
+        author = re.sub(r'\*', '', journalinfo[journalinfo.index('1')+1:
+                             journalinfo.index('2')][0])
+        authors = split_string(author)
+    return parser_fields(locals())
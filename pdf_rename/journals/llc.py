@@ -0,0 +1,43 @@
+"""Parser for Language and Linguistics Compass."""
+import re
+
+from ..text import first_index, get_index
+from . import parser_fields
+
+
+def parse_llc(info, subject, journalinfo, page_text, title, author):
+    """Language and Linguistics Compass."""
+    journaltitle = "Language and Linguistics Compass"
+    shortjournaltitle = "Lang Linguist Compass"
+    llc = page_text.lines()
+    if 'wileyonlinelibrary.com/journal/lnc3' in llc:
+        llc_info = llc[first_index(llc, lambda x: 'Lang Linguist' in x
+                                   or 'Lang. Linguist.' in x)]
+        # llc_info: 'Lang. Linguist. Compass. year; vol: pfirst-plast
+        values = re.search(r'.+? (\d{4}); (\d{1,3}): (\d{1,4})–(\d{1,4})',
+                           llc_info)
+        year = values.group(1)
+        volume = values.group(2)
+        number = ""
+        page_start, page_end = values.group(3), values.group(4)
+        doi = info['WPS-ARTICLEDOI'].decode('UTF-8')
+    else:
+        llc_info = llc[:get_index('Abstract', llc)]
+        # llc_info: ['journaltitle volume/number (year): pfirst-plast, doi',
+        # '', 'title', '', 'author(s)', ...]
+        author = re.sub(r'(\*)|(\d)', '',
+                        llc_info[get_index('*', llc_info)])
+        values = re.search(r'.+? (\d{1,2})/(\d{1}).+?\((\d{4})\): ' +
+                           r'(\d{1,4})–(\d{1,4}), (.*)', llc_info[0])
+        year = values.group(3)
+        volume, number = values.group(1), values.group(2)
+        page_start, page_end = values.group(4), values.group(5)
+        doi = values.group(6)
+    eid = ""
+    if 'þÿ' in title:
+        title_list = title.split('þÿ')[1].split('\x00')
+        title = ''
+        for char in title_list:
+            title = title + char
+    authors = author.split(' and ')
+    return parser_fields(locals())
@@ -0,0 +1,27 @@
+"""Parser for Language Resources and Evaluation."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_lre(info, subject, journalinfo, page_text, title, author):
+    """Language Resources and Evaluation."""
+    notes = []
+    journalinfo = page_text.lines()
+    journaltitle = "Language Resources and Evaluation"
+    shortjournaltitle = "Lang Resources & Evaluation"
+    values = re.search(r'Lang Resources & Evaluation \((\d{4})\) ' +
+                       r'(\d{1,2}):(\d{1,4}).(\d{1,4})',
+                       journalinfo[0])
+    year, volume = values.group(1), values.group(2)
+    number = ""
+    page_start = values.group(3)
+    page_end = values.group(4)
+    doi = get_doi_from_text(journalinfo, notes)
+    eid = ""
+    tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[journalinfo.index('2')+1:journalinfo.index('3')])
+    authors = ' '.join(journalinfo[journalinfo.index('3')+1:
+                                   journalinfo.index('4')]).split(' • ')
+    return parser_fields(locals())
@@ -0,0 +1,29 @@
+"""Parser for Language Science Press books (details on page 4)."""
+import re
+
+from ..text import get_doi_from_text
+from . import parser_fields
+
+
+def parse_lsp_book(info, subject, journalinfo, page_text, title, author):
+    """Language Science Press books (details on page 4)."""
+    notes = []
+    book_info = page_text.lines(3)
+    doi = get_doi_from_text(book_info, notes)
+    entry = ' '.join(book_info[:book_info.index('')])
+    values = re.search('(.+?). (\d{4}). (.+?) \((.+?) (\d{1,3})\)', entry)
+    author = re.sub(' &', ',', values.group(1))
+    if "eds." in author:
+        entry_type = "collection"
+        author_type = "editor"
+    else:
+        entry_type = "book"
+        author_type = "author"
+    authors = author.split(', ')
+    year = values.group(2)
+    title = values.group(3)
+    series = values.group(4)
+    number = values.group(5)
+    publisher = "Language Science Press"
+    location = "Berlin"
+    return parser_fields(locals())
@@ -0,0 +1,42 @@
+"""Parser for Chapters of Language Science Press volumes."""
+import re
+
+from ..record import PDFRenameError
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_lsp_chapter(info, subject, journalinfo, page_text, title, author):
+    """Chapters of Language Science Press volumes."""
+    notes = []
+    publisher = "Language Science Press"
+    location = "Berlin"
+    chapter = page_text.lines()
+    doi = get_doi_from_text(chapter, notes)
+    chapter.reverse()
+    tag_empty_items(chapter)
+    chapter.reverse()
+    entry = re.sub('- ', '',
+                   ' '.join(chapter[chapter.index('2')+1:chapter.index('1')]))
+    values = re.search(r'(.+?)\. (\d{4})\. (.+?)\. (.+?) \((ed|Hrsg).+?, ' +
+                       r'(.+?), (\d{1,4})–(\d{1,4})\.', entry)
+    try:
+        author = values.group(1)
+        authors = author.split(', ')
+        year = values.group(2)
+        title = values.group(3)
+        editors = re.sub('In ', '', values.group(4))
+        editors = re.sub(' & ', ', ', editors).split(', ')
+        booktitle = re.sub(r'([a-z][a-z])\. ([A-z][a-z])', r'\1: \2',
+                           values.group(6))
+        page_start = values.group(7)
+        page_end = values.group(8)
+    except AttributeError:
+        raise PDFRenameError("Sorry, I'm having trouble identifying " +
+                             "metadata other than " +
+                             "“" + publisher + "”...")
+    entry_type = "incollection"
+    author_type = "author"
+    series = ""
+    number = ""
+    return parser_fields(locals())
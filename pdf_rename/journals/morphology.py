@@ -0,0 +1,24 @@
+"""Parser for Morphology."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_morphology(info, subject, journalinfo, page_text, title, author):
+    """Morphology."""
+    notes = []
+    journaltitle = "Morphology"
+    shortjournaltitle = "Morphol"
+    values = re.search(r'Morphology \((\d{4})\) (\d{1,2}):(\d{1,4}).(\d{1,4})',
+                       journalinfo[0])
+    year, volume = values.group(1), values.group(2)
+    number = ""
+    page_start = values.group(3)
+    page_end = values.group(4)
+    doi = get_doi_from_text(journalinfo, notes)
+    eid = ""
+    tag_empty_items(journalinfo)
+    authors = ' '.join(journalinfo[journalinfo.index('2')+1:journalinfo.index('3')]).split(' and ')
+    title = ' '.join(journalinfo[journalinfo.index('3')+1:journalinfo.index('4')])
+    return parser_fields(locals())
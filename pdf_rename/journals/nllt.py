@@ -0,0 +1,33 @@
+"""Parser for Natural Language & Linguistic Theory."""
+import re
+
+from ..text import get_doi_from_text, get_index
+from . import parser_fields
+
+
+def parse_nllt(info, subject, journalinfo, page_text, title, author):
+    """Natural Language & Linguistic Theory."""
+    notes = []
+    # NLLT
+    journaltitle = r"Natural Language \& Linguistic Theory"
+    shortjournaltitle = "NLLT"
+    if 'doi' in info:
+        doi = info['doi'].decode('UTF-8')
+    else:
+        doi = get_doi_from_text(journalinfo, notes)
+    info = page_text.head(10)
+    nllt = re.search(r'.+?\((\d{4})\) (\d{1,2}):( |)(\d{1,4})(–|\^)(\d{1,4})',
+                     info[0])
+    year = nllt.group(1)
+    volume = nllt.group(2)
+    number = ""
+    if title == "":
+        title = info[get_index('Received', info)-4].strip(' ')
+    eid = ""
+    page_start = nllt.group(4)
+    page_end = nllt.group(6)
+    author = info[get_index('Received', info)-2]
+    author = re.sub(r'\d', '', author)
+    author = re.sub('¸s', 'ş', author)
+    authors = author.split(' · ')
+    return parser_fields(locals())
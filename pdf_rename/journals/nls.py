@@ -0,0 +1,37 @@
+"""Parser for Natural Language Semantics."""
+import re
+
+from ..text import get_doi_from_text
+from . import parser_fields
+
+
+def parse_nls(info, subject, journalinfo, page_text, title, author):
+    """Natural Language Semantics."""
+    notes = []
+    # NLLT
+    journaltitle = "Natural Language Semantics"
+    shortjournaltitle = "Nat Lang Semantics"
+    if 'doi' in info:
+        doi = info['doi'].decode('UTF-8')
+    else:
+        doi = get_doi_from_text(journalinfo, notes)
+    info = page_text.head(10)
+    nllt = re.search(r'.+?\((\d{4})\) (\d{1,2}):( |)(\d{1,4})(–|\^)(\d{1,4})',
+                     info[0])
+    year = nllt.group(1)
+    volume = nllt.group(2)
+    number = ""
+    if title == "":
+        title = info[info.index('')+1:]
+        title = ' '.join(title[:title.index('')])
+    eid = ""
+    page_start = nllt.group(4)
+    page_end = nllt.group(6)
+    author = info[info.index('')+1:]
+    author = author[author.index('')+1:]
+    author = author[:author.index('')][0]
+    author = re.sub(r'\d', '', author)
+    author = re.sub('¸s', 'ş', author)
+    author = re.sub('a´', 'á', author)
+    authors = author.split(' · ')
+    return parser_fields(locals())
@@ -0,0 +1,61 @@
+"""Parser for PNAS."""
+import re
+
+from ..text import first_index, get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_pnas(info, subject, journalinfo, page_text, title, author):
+    """PNAS."""
+    notes = []
+    journaltitle = 'PNAS'
+    shortjournaltitle = 'PNAS'
+    pattern = r'PNAS \d{4}'
+    journalinfo = journalinfo[first_index(journalinfo, lambda x: len(x) > 1):]
+    try:
+        pnas_info = journalinfo[first_index(
+            journalinfo, lambda x: re.search(pattern, x))]
+        values = re.search(r'PNAS (\d{4}) Vol. (\d{1,3}) No. (\d{1,3}) e(.*)',
+                           pnas_info)
+        year, volume, number = values.group(1), values.group(2), values.group(3)
+        eid = values.group(4)
+        doi = get_doi_from_text(journalinfo, notes).rstrip(
+            '/-/DC_Supplemental.')
+        pattern = r'(\d{1,3}) of (\d{1,3})'
+        pages = journalinfo[first_index(
+            journalinfo, lambda x: re.search(pattern, x))]
+        page_start = re.search(pattern, pages).group(1)
+        page_end = re.search(pattern, pages).group(2)
+        journalinfo = tag_empty_items(journalinfo)
+        authors = re.sub(r'\ue840', '', journalinfo[journalinfo.index('1')+1])
+        authors = re.sub(r',\d', '', authors).split('and')
+    except IndexError:
+        tag_empty_items(journalinfo)
+        title = ' '.join(journalinfo[0:journalinfo.index('1')])
+        title = re.sub('ﬁ', 'fi', title)
+        title = re.sub('ﬂ', 'fl', title)
+        authors = ' '.join(journalinfo[journalinfo.index('1') + 1:
+                                       journalinfo.index('2')])
+        authors = re.sub(', and', ', ', authors)
+        authors = re.sub(r',[a-z],', '', authors)
+        authors = re.sub(r',\d', '', authors)
+        authors = re.sub(r'ˇ(\w)', '\\1̌', authors)
+        authors = re.sub(r'´(\w)', '\\1́', authors)
+        authors = authors.split(', ')
+        info = re.compile(r'.+?(\d{4}) \|')
+        info = list(filter(info.match, journalinfo))[0]
+        values = re.search(r'.+?(\d{4}) \| ' +
+                           r'vol. (\d{1,4}) \| ' +
+                           r'no. (\d{1,3}) \| ' +
+                           r'(\d{1,6})–(\d{1,6})',
+                           info)
+        year = values.group(1)
+        volume = values.group(2)
+        number = values.group(3)
+        page_start = values.group(4)
+        page_end = values.group(5)
+        doi = re.compile(r'.+?org/cgi')
+        doi = list(filter(doi.match, journalinfo))
+        doi = get_doi_from_text(doi, notes)
+    eid = ""
+    return parser_fields(locals())
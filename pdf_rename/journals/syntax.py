@@ -0,0 +1,31 @@
+"""Parser for Syntax."""
+import re
+
+from . import parser_fields
+
+
+def parse_syntax(info, subject, journalinfo, page_text, title, author):
+    """Syntax."""
+    # Syntax
+    journaltitle = "Syntax"
+    shortjournaltitle = "Syntax"
+    syntax_info = page_text.lines_before('Abstract')
+    # syntax_info: ['Name Volume:Number, Month Year,
+    #               PageFirst–PageLast', '', 'TITLE', 'Author(s)', '']
+    authors = syntax_info[-2]
+    if 'þÿ' in title:
+        title_list = title.split('þÿ')[1].split('\x00')
+        title = ''
+        for char in title_list:
+            title = title + char
+    values = re.search(r'.+? (\d{1,2}):(\d{1}).+?(\d{4}), (\d{1,4})–(\d{1,4})',
+                       syntax_info[0])
+    volume, number, year = values.group(1), values.group(2), values.group(3)
+    page_start, page_end = values.group(4), values.group(5)
+    if 'WPS-ARTICLEDOI' in info:
+        doi = info['WPS-ARTICLEDOI'].decode('UTF-8')
+    else:
+        doi = ""
+    eid = ""
+    authors = authors.split(' and ')
+    return parser_fields(locals())
@@ -0,0 +1,47 @@
+"""Parser for Theoretical Linguistics."""
+import re
+
+from ..text import get_doi_from_text, get_index, tag_empty_items
+from . import parser_fields
+
+
+def parse_theoretical_linguistics(info, subject, journalinfo, page_text, title,
+                                  author):
+    """Theoretical Linguistics."""
+    notes = []
+    journaltitle = "Theoretical Linguistics"
+    shortjournaltitle = "Theor Linguist"
+    values = re.search('Theoretical Linguistics ' +
+                       r'(\d{4}); (\d{1,2})\((.+?)\): ' +
+                       r'(\d{1,4}).(\d{1,4})',
+                       subject)
+    if values is None:
+        values = re.search('Theoretical Linguistics ' +
+                           r'(\d{1,2}).(\d.+?) \((\d{4})\), ' +
+                           r'(\d{1,4})–(\d{1,4})',
+                           subject)
+        volume, number = values.group(1), values.group(2)
+        year = values.group(3)
+        page_start, page_end = values.group(4), values.group(5)
+    else:
+        volume, number = values.group(2), values.group(3)
+        year = values.group(1)
+        page_start, page_end = values.group(4), values.group(5)
+    eid = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    # Authors and titles are handled differently for different years ...
+    # Post 2007
+    tag_empty_items(journalinfo)
+    if int(year) > 2011:
+        title = ' '.join(journalinfo[journalinfo.index(subject)+3:journalinfo.index('2')])
+        author = re.sub(r'\*', '', journalinfo[journalinfo.index(subject)+2])
+        authors = author.split(' and ')
+    else:
+        # Up to 2011 (at least)
+        title = ' '.join(journalinfo[:get_index('1', journalinfo)])
+        author = ' '.join(journalinfo[get_index('1', journalinfo):
+                                      get_index('2', journalinfo)])
+        author = re.sub(r'\*', '', author)
+        author = re.sub(r'\d', '', author)
+        authors = author.split(' and ')
+    return parser_fields(locals())
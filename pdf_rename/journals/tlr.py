@@ -0,0 +1,61 @@
+"""Parser for The Linguistic Review."""
+import re
+
+from ..text import get_doi_from_text, get_index, tag_empty_items
+from . import parser_fields
+
+
+def parse_tlr(info, subject, journalinfo, page_text, title, author):
+    """The Linguistic Review."""
+    notes = []
+    # TLR
+    journaltitle = "The Linguistic Review"
+    shortjournaltitle = "Linguist Rev"
+    if 'Linguistic Review' in journalinfo[0]:
+        tlr = tag_empty_items(journalinfo)
+        author = re.sub('\*', '', tlr[tlr.index('1')+1])
+        title = tlr[tlr.index('1')+2]
+        values = re.search('Linguistic Review ' +
+                           r'(\d{4}); (\d{1,3})\((\d{1})\): ' +
+                           r'(\d{1,4})–(\d{1,4})',
+                           tlr[0])
+        if values == None:
+            data = [item for item in tlr if item.isupper()]
+            title = re.sub('\*', '', data[0].lower().capitalize())
+            author = data[1]
+            tlr_info = tlr[get_index('The  Linguistic Review', tlr)]
+            values = re.search('Linguistic Review ' +
+                               r'(\d{1,2}) \((\d{4}).(\d{4})\) ' +
+                               r'(\d{1,4}).(\d{1,4})',
+                               tlr_info)
+            volume, year = values.group(1), values.group(3)
+            number = ""
+            page_start, page_end = values.group(4), values.group(5)
+        else:
+            volume, year = values.group(2), values.group(1)
+            number = values.group(3)
+            page_start, page_end = values.group(4), values.group(5)
+    else:
+        author = journalinfo[journalinfo.index('')+1:
+                             journalinfo.index('Abstract')-1]
+        title = ' '.join(journalinfo[:journalinfo.index('')])
+        values = re.search('The Linguistic Review ' +
+                           r'(\d{1,2}) \((\d{4})\), (\d{1,4})–(\d{1,4})',
+                           journalinfo[-7])
+        volume, year = values.group(1), values.group(2)
+        number = ''
+        page_start, page_end = values.group(3), values.group(4)
+        if len(author) > 1:
+            authors = author[0].split(', ') + [author[1]]
+            authors = [re.sub(' AND', '', auth) for auth in authors]
+            authors = [re.sub(' and', '', auth) for auth in authors]
+        elif type(author) == list:
+            authors = author[0].split(' AND ')
+            authors = author[0].split(' and ')
+        else:
+            authors = author.split(' AND ')
+            authors = author.split(' and ')
+    doi = get_doi_from_text(journalinfo, notes)
+    eid = ""
+    authors = author.split(' and ')
+    return parser_fields(locals())
@@ -0,0 +1,24 @@
+"""Parser for Linguistic Typology (volumes cited by year)."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_typology(info, subject, journalinfo, page_text, title, author):
+    """Linguistic Typology (volumes cited by year)."""
+    notes = []
+    journaltitle = "Linguistic Typology"
+    shortjournaltitle = "Linguist Typol"
+    tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[journalinfo.index('1')+2:
+                                 journalinfo.index('2')])
+    values = re.search(r'Linguistic Typology (\d{4}); ' +
+                       r'(\d{1,2})\((\d{1})\): (\d{1,4})–(\d{1,4})', subject)
+    volume, number, year = values.group(2), values.group(3), values.group(1)
+    page_start, page_end = values.group(4), values.group(5)
+    eid = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    author = re.sub(r'\*', '', journalinfo[journalinfo.index('1')+1])
+    authors = author.split(' and ')
+    return parser_fields(locals())
@@ -0,0 +1,26 @@
+"""Parser for Linguistic Typology (volumes cited by number)."""
+import re
+
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_typology_old(info, subject, journalinfo, page_text, title, author):
+    """Linguistic Typology (volumes cited by number)."""
+    notes = []
+    journaltitle = "Linguistic Typology"
+    shortjournaltitle = "Linguist Typol"
+    tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[:journalinfo.index('1')])
+    values = re.search(r'Linguistic Typology (\d{1,2}) \((\d{4})\), ' +
+                       r'(\d{1,4})–(\d{1,4})', subject)
+    volume, number, year = values.group(1), "", values.group(2)
+    page_start, page_end = values.group(3), values.group(4)
+    eid = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    author = re.sub(r'\*', '',
+                    ' '.join(journalinfo[journalinfo.index('1'):
+                                         journalinfo.index('2')]))
+    author = re.sub(r'\d', '', author)
+    authors = author.split(' and ')
+    return parser_fields(locals())
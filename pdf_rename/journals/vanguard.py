@@ -0,0 +1,25 @@
+"""Parser for Linguistics Vanguard."""
+import re
+
+from ..names import split_string
+from ..text import get_doi_from_text, tag_empty_items
+from . import parser_fields
+
+
+def parse_vanguard(info, subject, journalinfo, page_text, title, author):
+    """Linguistics Vanguard."""
+    notes = []
+    journaltitle = "Linguistics Vanguard"
+    shortjournaltitle = "Linguistics Vanguard"
+    values = re.search('Linguistics Vanguard ' +
+                       r'(\d{4}); (\d{1,2})\((.+?)\): (.*)', subject)
+    volume, number, year = values.group(2), values.group(3), values.group(1)
+    page_start, page_end = "1", ""
+    eid = values.group(4)
+    doi = get_doi_from_text(journalinfo, notes)
+    tag_empty_items(journalinfo)
+    title = ' '.join(journalinfo[journalinfo.index('1')+2:
+                                 journalinfo.index('2')])
+    author = re.sub(r'\*', '', journalinfo[2])
+    authors = split_string(author)
+    return parser_fields(locals())
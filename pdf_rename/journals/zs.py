@@ -0,0 +1,55 @@
+"""Parser for Zeitschrift für Sprachwissenschaft."""
+import re
+
+from ..text import get_doi_from_text, get_index, tag_empty_items
+from . import parser_fields
+
+
+def parse_zs(info, subject, journalinfo, page_text, title, author):
+    """Zeitschrift für Sprachwissenschaft."""
+    notes = []
+    journaltitle = "Zeitschrift für Sprachwissenschaft"
+    shortjournaltitle = "Zeitschrift für Sprachwissenschaft"
+    values = re.search('Zeitschrift für Sprachwissenschaft ' +
+                       r'(\d{4}); (\d{1,2})\((\d{1}–\d{1})\): ' +
+                       r'(\d{1,4}) – (\d{1,4})',
+                       subject)
+    if values is None:
+        # values = re.search('Zeitschrift für Sprachwissenschaft ' +
+        #                    r'(\d{1,2}) \((\d{4})\), (\d{1,4})–(\d{1,4})',
+        #                    subject)
+        values = re.search('Zeitschrift für Sprachwissenschaft ' +
+                           r'(\d{1,2}) \((\d{4})\), ' +
+                           r'(\d{1,4})\(cid:2\)(\d{1,4})',
+                           subject)
+        volume, number = values.group(1), ''
+        year = values.group(2)
+        page_start, page_end = values.group(3), values.group(4)
+#        values = re.search('Zeitschrift für Sprachwissenschaft ' +
+#                           r'(\d{4}); (\d{1,2})\((\d)\): ' +
+#                           r'(\d{1,4})–(\d{1,4})',
+#                           subject)
+#        volume, number = values.group(2), values.group(3)
+#        year = values.group(1)
+#        page_start, page_end = values.group(4), values.group(6)
+    else:
+        volume, number = values.group(2), values.group(3)
+        year = values.group(1)
+        page_start, page_end = values.group(4), values.group(5)
+    eid = ""
+    doi = get_doi_from_text(journalinfo, notes)
+    # Authors and titles are handled differently for different years ...
+    # Post 2009
+    if int(year) > 2009:
+        title = journalinfo[journalinfo.index(subject)+3]
+        author = re.sub(r'\*', '', journalinfo[journalinfo.index(subject)+2])
+    else:
+        # Up to 2009 (at least)
+        tag_empty_items(journalinfo)
+        title = ' '.join(journalinfo[:get_index('1', journalinfo)])
+        author = ' '.join(journalinfo[get_index('1', journalinfo):
+                                      get_index('2', journalinfo)])
+        author = re.sub(r'\*', '', author)
+        author = re.sub(r'\d', '', author)
+    authors = author.split(' and ')
+    return parser_fields(locals())
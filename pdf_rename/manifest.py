@@ -0,0 +1,97 @@
+"""Manifest of processed files, for incremental rescans."""
+import os
+import sqlite3
+
+from .cache import CACHE_PATH, cache_version, expand_path
+
+MANIFEST_PATH = os.path.join(os.path.dirname(CACHE_PATH), 'manifest.sqlite')
+
+
+class Manifest:
+    """
+    Record of the files processed so far, for incremental rescans.
+
+    For each path, the device, inode, size and modification time are kept,
+    together with whether the file could be processed and the parser
+    version (see cache_version). A file whose stat data are unchanged is
+    not opened again; failed files are retried when the parsers change.
+    Files renamed since (by this script or otherwise) are recognised by
+    their device and inode. The whole manifest is held in memory, so
+    checking a file costs a single stat.
+    """
+
+    def __init__(self, path):
+        path = expand_path(path)
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.version = cache_version()
+        self.db = sqlite3.connect(path, timeout=60)
+        self.db.execute('CREATE TABLE IF NOT EXISTS files ('
+                        'path TEXT PRIMARY KEY, device INTEGER, '
+                        'inode INTEGER, size INTEGER, mtime INTEGER, '
+                        'ok INTEGER, version TEXT)')
+        self.files = {}
+        self.inodes = {}
+        for row in self.db.execute('SELECT * FROM files'):
+            self.files[row[0]] = row[1:]
+            self.inodes[row[1], row[2]] = row[0]
+
+    def unchanged(self, path):
+        """
+        Return True if path was processed before and has not changed.
+
+        A file that has been renamed since it was processed counts as
+        unchanged; its entry is moved to the new path.
+        """
+        try:
+            st = os.stat(path)
+        except OSError:
+            return False
+        path = os.path.abspath(path)
+        known = self.files.get(path)
+        if known is None:
+            old = self.inodes.get((st.st_dev, st.st_ino))
+            if old is None or os.path.exists(old):
+                return False
+            self.move(old, path)
+            known = self.files[path]
+        return (known[:4] == (st.st_dev, st.st_ino, st.st_size,
+                              st.st_mtime_ns)
+                and (known[4] or known[5] == self.version))
+
+    def add(self, path, ok=True):
+        """Record path as processed (successfully, if ok)."""
+        st = os.stat(path)
+        path = os.path.abspath(path)
+        entry = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns, int(ok),
+                 self.version)
+        self.files[path] = entry
+        self.inodes[entry[:2]] = path
+        self.db.execute('INSERT OR REPLACE INTO files VALUES '
+                        '(?, ?, ?, ?, ?, ?, ?)', (path,) + entry)
+
+    def move(self, old, new):
+        """
+        Move the entry of old to new, after old was renamed, replacing the
+        entry of new (e.g. a file renamed back onto a name it had before).
+        """
+        old, new = os.path.abspath(old), os.path.abspath(new)
+        if old == new or old not in self.files:
+            return
+        entry = self.files.pop(old)
+        replaced = self.files.get(new)
+        if replaced is not None and self.inodes.get(replaced[:2]) == new:
+            del self.inodes[replaced[:2]]
+        self.files[new] = entry
+        self.inodes[entry[:2]] = new
+        self.db.execute('DELETE FROM files WHERE path = ?', (new,))
+        self.db.execute('UPDATE files SET path = ? WHERE path = ?',
+                        (new, old))
+
+    def commit(self):
+        self.db.commit()
+
+    def close(self):
+        self.db.commit()
+        self.db.close()
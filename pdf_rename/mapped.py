@@ -0,0 +1,80 @@
+"""Memory-mapped input files, shared by the stages that read them."""
+import mmap
+import os
+
+
+class MappedFile:
+    """
+    A read-only memory map of a file.
+
+    The file is mapped once and read through views (see view()), each
+    with its own position, and hashed through data, without going through
+    Python's file buffers. Use it as a context manager, or close() it when
+    done.
+    """
+
+    def __init__(self, filename):
+        self.filename = filename
+        with open(filename, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                self.data = b''  # empty files cannot be mapped
+            else:
+                self.data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def view(self):
+        """Return a new MappedView of the file."""
+        return MappedView(self.data)
+
+    def close(self):
+        if isinstance(self.data, mmap.mmap):
+            self.data.close()
+
+
+class MappedView:
+    """
+    A seekable binary file reading from data (e.g. a memory map).
+
+    Provides the methods of a file that pdfminer's parsers and PDFFile
+    use; views on the same data do not share their position.
+    """
+
+    def __init__(self, data):
+        self.data = data
+        self.position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        pass
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        if whence == os.SEEK_CUR:
+            offset = self.position + offset
+        elif whence == os.SEEK_END:
+            offset = len(self.data) + offset
+        self.position = max(0, offset)
+        return self.position
+
+    def tell(self):
+        return self.position
+
+    def read(self, size=-1):
+        start = self.position
+        if size is None or size < 0:
+            self.position = len(self.data)
+        else:
+            self.position = min(len(self.data), start + size)
+        return self.data[start:self.position]
+
+    def readline(self, size=-1):
+        end = self.data.find(b'\n', self.position) + 1 or len(self.data)
+        if size is not None and size >= 0:
+            end = min(end, self.position + size)
+        return self.read(end - self.position)
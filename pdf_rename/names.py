@@ -0,0 +1,68 @@
+"""Formatting of author and editor names."""
+import functools
+
+from nameparser import HumanName
+
+from .record import PDFRenameError
+
+NAME_CACHE_SIZE = 4096
+
+
+class Author:
+    """A parsed name: first, middle and last name, and its citekey form."""
+
+    __slots__ = ('first', 'middle', 'last', 'citekey')
+
+    def __init__(self, first, middle, last):
+        self.first = first
+        self.middle = middle
+        self.last = last
+        self.citekey = last.replace(' ', '')
+
+    def __repr__(self):
+        return 'Author(%r, %r, %r)' % (self.first, self.middle, self.last)
+
+    def full(self):
+        """The name as 'Last, First Middle'."""
+        return self.last + ', ' + self.first + pad(self.middle)
+
+
+@functools.lru_cache(maxsize=NAME_CACHE_SIZE)
+def parse_name(name):
+    """Parse name into an Author; results are shared by all files."""
+    name = HumanName(name)
+    return Author(name.first.title(), name.middle, name.last.title())
+
+
+def name_authors(author_list):
+    """
+    Create list of authors separated by ',' and 'and'.
+
+    Raises PDFRenameError if author_list is empty.
+    """
+    if not author_list:
+        raise PDFRenameError("Sorry, I'm having trouble identifying the " +
+                             "authors...")
+    authors = [parse_name(author) for author in author_list]
+    citekey = ''.join(author.citekey for author in authors)
+    names_file = ', '.join(author.last for author in authors)
+    names_full = ' and '.join(author.full() for author in authors)
+    return [citekey, names_file, names_full]
+
+
+def pad(name):
+    """Add a space if name is a non-empty string."""
+    if name != '':
+        return ' ' + name
+    else:
+        return ''
+
+
+def split_string(string):
+    """
+    Convert a string of names separated by commas and “and” to a list.
+
+    A string of the structure "Name1, Name2 and Name3" is converted to
+    a list where each item corresponds to a name.
+    """
+    return(string.split(',')[:-1] + string.split(',')[-1].split('and'))
@@ -0,0 +1,180 @@
+"""Extraction of a Record from a PDF."""
+import re
+
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import PDFObjRef
+
+from .journals import registry
+from .mapped import MappedFile
+from .pdffile import DamagedPDF, PDFFile
+from .profiling import Timings
+from .record import PDFRenameError, Record
+from .text import HEAD_FRACTION, PageLines, PageText, first_index
+from .xmp import read_xmp, xmp_fields
+
+
+def parse_info(key, info, subject, title, author):
+    """
+    Return the fields found by parser key (one of info_parsers) in the
+    document information alone, or None if it needs the page text.
+    """
+    try:
+        return registry.function(key)(info, subject, None, None, title,
+                                      author)
+    except Exception:
+        return None
+
+
+def open_document(f):
+    """
+    Return a PDFFile for the PDF in the binary file f, or a PDFDocument
+    if it is encrypted or its cross-reference table is damaged (which
+    PDFDocument can often recover by scanning the whole file).
+    """
+    try:
+        doc = PDFFile(f)
+        if not doc.encrypted:
+            return doc
+    except DamagedPDF:
+        pass
+    return PDFDocument(PDFParser(f))
+
+
+def parse_xmp_record(doc):
+    """
+    Return the parser key and the fields found in the XMP metadata of doc,
+    or (None, None) if its journal is not in xmp_journals or fields are
+    missing.
+    """
+    properties = read_xmp(doc)
+    name = properties.get('prism:publicationName', [''])[0]
+    registry.load_plugins()
+    journal = registry.xmp_journals.get(name.lower())
+    if journal is None:
+        return None, None
+    fields = xmp_fields(properties, journal)
+    if fields is None:
+        return None, None
+    return journal[0], fields
+
+
+def clean_record(record):
+    """Tidy up the titles of record and split off subtitles."""
+    record.title = re.sub(' \x10', '-', record.title)
+    record.title = re.sub(' \x00', ' ', record.title)
+    record.title = re.sub('þÿ', '', record.title)
+    if ': ' in record.title:
+        record.subtitle = record.title.split(': ')[1].capitalize()
+        record.title = record.title.split(':')[0]
+    if '_' in record.title:
+        record.subtitle = record.title.split('_ ')[1]
+        record.title = record.title.split('_')[0]
+    if ': ' in record.booktitle:
+        record.booksubtitle = record.booktitle.split(': ')[1].capitalize()
+        record.booktitle = record.booktitle.split(':')[0]
+    return record
+
+
+def parse_pdf(filename, head_fraction=HEAD_FRACTION, timings=None,
+              mapped=None, page_text=None):
+    """
+    Extract bibliographic information from the PDF filename.
+
+    Returns a Record with the fields used for renaming the file and for
+    the biblatex entry. Raises PDFRenameError if the journal or its
+    metadata cannot be identified. head_fraction is the fraction of the
+    first page laid out for journals that only need its head (see
+    PageText). If timings is given, the stages of parsing are timed in
+    it.
+
+    The XMP metadata is preferred for the journals in xmp_journals, and
+    journals whose parser only needs the document information (see
+    info_parsers) are parsed from it; then no page is laid out, if the
+    metadata is complete.
+
+    The file is read through the MappedFile mapped, which is opened (and
+    closed again) if not given. Pages are laid out with the PageText
+    page_text, if given, so that the caller can use the text afterwards.
+    """
+    if mapped is None:
+        with MappedFile(filename) as mapped:
+            return parse_pdf(filename, head_fraction, timings, mapped,
+                             page_text)
+    timings = timings or Timings()
+    with timings.stage('open'):
+        doc = open_document(mapped.view())
+        info = doc.info[0]
+        with timings.stage('xmp'):
+            key, fields = parse_xmp_record(doc)
+    if fields is not None:
+        timings.journal = key
+        return clean_record(Record(**fields))
+    if page_text is None:
+        page_text = PageText(filename, head_fraction, timings, mapped)
+    with timings.stage('detect'):
+        author = None
+        journalinfo = None
+
+        # The following two if-statements check for PDF metadata.
+        # If they are specified, authors and titles are set based on them.
+
+        if ('Author' in info
+                and info['Author'] != b''
+                and not type(info['Author'].decode('ISO-8859-1')) != str):
+            author = info['Author'].decode('ISO-8859-1')
+
+        if ('Title' in info
+                and info['Title'] != b''
+                and not type(info['Title'].decode('ISO-8859-1')) != str):
+            title = re.sub(b'\\x84', b'---',
+                           info['Title']).decode('ISO-8859-1')
+        else:
+            title = ""
+
+        try:
+            if ('Subject' in info
+                    and not isinstance(info['Subject'], PDFObjRef)
+                    and info['Subject'] != b''
+                    and 'Downloaded from' not in
+                    info['Subject'].decode('ISO-8859-1')):
+                subject = re.sub(b'\\x85', b'-',
+                                 info['Subject']).decode('ISO-8859-1')
+                key = registry.find(subject, title)
+                if key in registry.info_parsers:
+                    with timings.stage('parse'):
+                        fields = parse_info(key, info, subject, title, author)
+                if fields is None and subject not in registry.journals:
+                    journalinfo = page_text.lines()
+                    subject = journalinfo[first_index(
+                        journalinfo, registry.journal_re.search)]
+            else:
+                journalinfo = page_text.lines()
+                if any('Source: ' in line for line in journalinfo):
+                    # remove empty strings
+                    journalinfo = PageLines(str for str in journalinfo if str)
+                    subject = 'JSTOR'
+                else:
+                    subject = journalinfo[first_index(
+                        journalinfo, registry.journal_re.search)]
+        except IndexError or NameError:
+            raise PDFRenameError("Sorry, I'm having trouble identifying the " +
+                                 "journal...")
+
+        if fields is None:
+            key = registry.find(subject, title)
+            if key is None:
+                raise PDFRenameError("Sorry, I'm having trouble " +
+                                     "identifying the journal...")
+
+    timings.journal = key
+    if fields is None:
+        with timings.stage('parse'):
+            fields = registry.function(key)(info, subject, journalinfo,
+                                            page_text, title, author)
+    record = clean_record(Record(**fields))
+
+    if not record.authors:
+        raise PDFRenameError("Sorry, I'm having trouble identifying the " +
+                             "authors...")
+    return record
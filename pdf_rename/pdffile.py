@@ -0,0 +1,203 @@
+"""Reading the trailer and a few objects of a PDF without PDFDocument."""
+import re
+
+from pdfminer.pdfdocument import PDFXRefStream
+from pdfminer.pdfexceptions import PDFException, PDFObjectNotFound
+from pdfminer.pdfparser import PDFParser, PDFStreamParser, PDFSyntaxError
+from pdfminer.pdftypes import PDFStream, dict_value
+from pdfminer.psparser import KWD, PSException
+
+from .record import PDFRenameError
+
+# Bytes read from the end of the file to find startxref.
+TAIL_SIZE = 2048
+
+
+# Maximum number of xref sections followed through /Prev (incremental
+# updates), which also guards against loops in damaged files.
+MAX_SECTIONS = 64
+
+
+KEYWORD_OBJ = KWD(b'obj')
+KEYWORD_TRAILER = KWD(b'trailer')
+
+
+class DamagedPDF(PDFRenameError):
+    """The trailer or cross-reference table of a PDF cannot be read."""
+
+
+class XRefTable:
+    """
+    A cross-reference table ('xref' section) of a PDF.
+
+    Only the positions of the subsections are read; the entry for an
+    object is read when it is looked up, as entries have a fixed size.
+    """
+
+    def __init__(self, fp, offset):
+        self.fp = fp
+        self.subsections = []
+        fp.seek(offset)
+        if fp.readline().strip() != b'xref':
+            raise DamagedPDF('no xref table at offset ' + str(offset))
+        while True:
+            position = fp.tell()
+            line = fp.readline()
+            header = re.match(rb'\s*(\d+)\s+(\d+)\s*$', line)
+            if header is None:
+                break
+            start, count = int(header.group(1)), int(header.group(2))
+            entry = fp.readline() if count else b''
+            size = len(entry)
+            if count and not 19 <= size <= 21:
+                raise DamagedPDF('bad xref entry at ' + str(fp.tell()))
+            self.subsections.append((start, count, fp.tell() - size, size))
+            fp.seek(fp.tell() - size + count * size)
+        # The trailer dictionary follows the last subsection.
+        if b'trailer' not in line:
+            raise DamagedPDF('no trailer at offset ' + str(position))
+        self.trailer_offset = position + line.index(b'trailer')
+
+    def get_pos(self, objid):
+        """Return (None, offset, generation) of objid, as PDFXRefStream."""
+        for start, count, base, size in self.subsections:
+            if start <= objid < start + count:
+                self.fp.seek(base + (objid - start) * size)
+                entry = self.fp.read(size).split()
+                if len(entry) == 3 and entry[2] == b'n':
+                    return None, int(entry[0]), int(entry[1])
+        raise KeyError(objid)
+
+
+class PDFFile:
+    """
+    The trailer, /Info and /Root of the PDF in the binary file fp.
+
+    Only startxref, the cross-reference sections and the objects that are
+    looked up are read; info and catalog can be used like those of a
+    PDFDocument. Raises DamagedPDF if the trailer or the cross-reference
+    sections cannot be read. If the file is encrypted (encrypted is
+    true), its strings are not decrypted, so a PDFDocument is needed.
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.parser = PDFParser(fp)
+        self.parser.set_document(self)
+        self.decipher = None
+        self.xrefs = []
+        self.objects = {}
+        try:
+            self.trailer = self.read_xrefs(self.startxref())
+            self.encrypted = 'Encrypt' in self.trailer
+            self.info = []
+            if 'Info' in self.trailer and not self.encrypted:
+                self.info.append(dict_value(self.trailer['Info']))
+        except (PDFException, PSException, KeyError, TypeError,
+                ValueError) as error:
+            raise DamagedPDF(str(error))
+        self._catalog = None
+
+    @property
+    def catalog(self):
+        """The document catalog (/Root), read when first used."""
+        if self._catalog is None:
+            self._catalog = dict_value(self.trailer.get('Root'))
+        return self._catalog
+
+    def startxref(self):
+        """Return the offset given after startxref at the end of the file."""
+        size = self.fp.seek(0, 2)
+        self.fp.seek(max(0, size - TAIL_SIZE))
+        tail = self.fp.read()
+        match = re.search(rb'startxref\s+(\d+)\s*(%%EOF)?\s*$',
+                          tail.rstrip(b'\0'))
+        if match is None:
+            match = list(re.finditer(rb'startxref\s+(\d+)', tail))
+            if not match:
+                raise DamagedPDF('no startxref')
+            match = match[-1]
+        return int(match.group(1))
+
+    def read_xrefs(self, offset):
+        """
+        Read the cross-reference section at offset and those of earlier
+        revisions, newest first. Returns the newest trailer.
+        """
+        trailer = None
+        seen = set()
+        offsets = [offset]
+        while offsets and len(self.xrefs) < MAX_SECTIONS:
+            offset = offsets.pop(0)
+            if offset in seen:
+                continue
+            seen.add(offset)
+            self.fp.seek(offset)
+            if self.fp.read(4) == b'xref':
+                xref = XRefTable(self.fp, offset)
+                self.parser.seek(xref.trailer_offset)
+                (_, keyword) = self.parser.nexttoken()
+                if keyword is not KEYWORD_TRAILER:
+                    raise DamagedPDF('no trailer at ' + str(offset))
+                (_, section) = self.parser.nextobject()
+                section = dict_value(section)
+            else:
+                xref = PDFXRefStream()
+                self.parser.seek(offset)
+                xref.load(self.parser)
+                section = xref.get_trailer()
+            self.xrefs.append(xref)
+            trailer = trailer or section
+            # Hybrid files have an xref stream besides the table.
+            for key in ('XRefStm', 'Prev'):
+                if key in section:
+                    offsets.append(int(section[key]))
+        return trailer
+
+    def getobj(self, objid):
+        """Return the object objid (used to resolve PDFObjRefs)."""
+        if objid in self.objects:
+            return self.objects[objid]
+        for xref in self.xrefs:
+            try:
+                stream, position, _ = xref.get_pos(objid)
+            except KeyError:
+                continue
+            if stream is None:
+                obj = self.parse_object(objid, position)
+            else:
+                obj = self.stream_object(stream, position)
+            self.objects[objid] = obj
+            return obj
+        raise PDFObjectNotFound(objid)
+
+    def parse_object(self, objid, offset):
+        """Return the object objid from the file at offset."""
+        self.parser.seek(offset)
+        (_, number) = self.parser.nexttoken()
+        (_, _) = self.parser.nexttoken()
+        (_, keyword) = self.parser.nexttoken()
+        if number != objid or keyword is not KEYWORD_OBJ:
+            raise PDFSyntaxError('object ' + str(objid) + ' not at offset ' +
+                                 str(offset))
+        (_, obj) = self.parser.nextobject()
+        return obj
+
+    def stream_object(self, streamid, index):
+        """Return the index-th object of the object stream streamid."""
+        stream = self.getobj(streamid)
+        if not isinstance(stream, PDFStream):
+            raise PDFSyntaxError('object ' + str(streamid) +
+                                 ' is not an object stream')
+        data = stream.get_data()
+        first = int(stream['First'])
+        parser = PDFStreamParser(data[:first])
+        numbers = []
+        while len(numbers) < 2 * (index + 1):
+            (_, number) = parser.nexttoken()
+            numbers.append(number)
+        parser = PDFStreamParser(data)
+        parser.set_document(self)
+        parser.seek(first + int(numbers[2 * index + 1]))
+        (_, obj) = parser.nextobject()
+        return obj
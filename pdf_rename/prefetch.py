@@ -0,0 +1,58 @@
+"""Reading the heads and tails of upcoming files ahead of parsing."""
+import collections
+import concurrent.futures
+import itertools
+
+# Files read ahead of the one being parsed.
+PREFETCH_DEPTH = 8
+
+
+IO_THREADS = 4
+
+
+# Bytes read from the start and the end of each file: enough for the
+# trailer, the info dict and (usually) the first page.
+HEAD_SIZE = 1 << 19
+TAIL_SIZE = 1 << 16
+
+
+def warm(filename, head=HEAD_SIZE, tail=TAIL_SIZE):
+    """
+    Read the head and tail of filename, so that they are in the page
+    cache when the file is mapped for parsing (see MappedFile).
+    """
+    with open(filename, 'rb', buffering=0) as f:
+        size = f.seek(0, 2)
+        f.seek(0)
+        f.read(head)
+        if size > head:
+            f.seek(max(head, size - tail))
+            f.read(tail)
+
+
+def prefetch(filenames, depth=PREFETCH_DEPTH, threads=IO_THREADS):
+    """
+    Yield filenames in order, each once its head and tail have been read
+    by a pool of I/O threads.
+
+    At most depth files are read ahead of the one last yielded, so reading
+    waits for a slow consumer. Errors are ignored here; they are reported
+    when the file is parsed.
+    """
+    filenames = iter(filenames)
+    if depth < 1:
+        yield from filenames
+        return
+    with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+        pending = collections.deque(
+            (filename, executor.submit(warm, filename))
+            for filename in itertools.islice(filenames, depth))
+        while pending:
+            filename, future = pending.popleft()
+            try:
+                future.result()
+            except OSError:
+                pass
+            for upcoming in itertools.islice(filenames, 1):
+                pending.append((upcoming, executor.submit(warm, upcoming)))
+            yield filename
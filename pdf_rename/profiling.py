@@ -0,0 +1,67 @@
+"""Timing and profiling of the stages of processing a file."""
+import contextlib
+import hashlib
+import os
+import pstats
+import time
+
+
+class Timings:
+    """
+    Wall-clock time spent in the stages of processing a file.
+
+    Stages are timed with the stage() context manager and may be nested;
+    the time spent in a nested stage is not counted for the enclosing one,
+    so the times of all stages add up to the total. journal is set to the
+    key of the parser used, if any.
+    """
+
+    def __init__(self):
+        self.stages = {}
+        self.journal = None
+        self._active = []
+        self._since = None
+
+    def _charge(self, now):
+        name = self._active[-1]
+        self.stages[name] = self.stages.get(name, 0) + now - self._since
+        self._since = now
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        now = time.perf_counter()
+        if self._active:
+            self._charge(now)
+        self._active.append(name)
+        self._since = now
+        try:
+            yield
+        finally:
+            self._charge(time.perf_counter())
+            self._active.pop()
+
+    def update(self, stages):
+        """Add the times of stages (e.g. from a worker process)."""
+        for name, seconds in stages.items():
+            self.stages[name] = self.stages.get(name, 0) + seconds
+
+
+def profile_path(directory, filename):
+    """Return the path of the cProfile dump for filename in directory."""
+    key = hashlib.sha1(os.path.abspath(filename).encode('utf-8',
+                                                        'surrogateescape'))
+    return os.path.join(directory, key.hexdigest()[:8] + '-' +
+                        os.path.basename(filename) + '.prof')
+
+
+def merge_profiles(directory, profiles):
+    """
+    Merge cProfile dumps per journal.
+
+    profiles maps journal keys to the dumps for their files; the merged
+    statistics are written to journal-<key>.prof in directory.
+    """
+    for journal, paths in profiles.items():
+        stats = pstats.Stats(*paths)
+        stats.dump_stats(os.path.join(directory,
+                                      'journal-' + journal + '.prof'))
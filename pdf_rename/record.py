@@ -0,0 +1,37 @@
+"""Records of the bibliographic information extracted from PDFs."""
+import dataclasses
+
+
+class PDFRenameError(Exception):
+    """Raised when a PDF's journal or metadata cannot be identified."""
+
+
+@dataclasses.dataclass
+class Record:
+    """
+    Bibliographic information about a PDF, as returned by parse_pdf.
+
+    All fields are strings, except for the lists authors, editors and
+    notes (remarks to show the user along with the biblatex entry).
+    """
+    authors: list = dataclasses.field(default_factory=list)
+    editors: list = dataclasses.field(default_factory=list)
+    year: str = ""
+    title: str = ""
+    subtitle: str = ""
+    journaltitle: str = ""
+    shortjournaltitle: str = ""
+    volume: str = ""
+    number: str = ""
+    page_start: str = ""
+    page_end: str = ""
+    doi: str = ""
+    eid: str = ""
+    entry_type: str = "article"
+    author_type: str = "author"
+    booktitle: str = ""
+    booksubtitle: str = ""
+    series: str = ""
+    location: str = ""
+    publisher: str = ""
+    notes: list = dataclasses.field(default_factory=list)
@@ -0,0 +1,338 @@
+"""Extraction of the text lines of PDF pages, and helpers for them."""
+import re
+
+from pdfminer.converter import PDFPageAggregator
+from pdfminer.layout import LAParams, LTContainer, LTText, LTTextBox
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+
+from .profiling import Timings
+from .record import PDFRenameError
+
+# Parsers that only read the head of the first page have only this
+# fraction of the page laid out (see PageText).
+HEAD_FRACTION = 0.5
+
+
+# Strings marking the lines parsers look for, whose first positions are
+# kept by PageLines.
+MARKERS = ('Abstract:', 'DOI: ', 'Source:', '@')
+
+
+class RegionAggregator(PDFPageAggregator):
+    """
+    Page aggregator that only lays out the top of a page.
+
+    Layout objects lying entirely below the top fraction of the page are
+    dropped before layout analysis, which is the expensive part of text
+    extraction.
+    """
+
+    def __init__(self, rsrcmgr, laparams=None, top=None):
+        PDFPageAggregator.__init__(self, rsrcmgr, laparams=laparams)
+        self.top = top
+
+    def end_page(self, page):
+        ltpage = self.cur_item
+        if self.top is not None:
+            bottom = ltpage.y1 - self.top * ltpage.height
+            ltpage._objs = [obj for obj in ltpage._objs if obj.y1 > bottom]
+        PDFPageAggregator.end_page(self, page)
+
+
+def render_lines(ltpage):
+    """
+    Yield the text lines of a laid out page in reading order.
+
+    The lines are the same as those of extract_text(...).split('\n'):
+    text boxes are followed by an empty line and the page ends with a
+    form feed.
+    """
+    def render(item):
+        if isinstance(item, LTContainer):
+            for child in item:
+                yield from render(child)
+        elif isinstance(item, LTText):
+            yield item.get_text()
+        if isinstance(item, LTTextBox):
+            yield '\n'
+
+    line = ''
+    for text in render(ltpage):
+        *complete, line = (line + text).split('\n')
+        yield from complete
+    yield line + '\f'
+
+
+def doi_candidate(line):
+    """Return whether line may contain a DOI (see get_doi_from_text)."""
+    return ('doi.org' in line or '10.' in line or 'doi: ' in line or
+            'DOI ' in line)
+
+
+class PageLines(list):
+    """
+    The lines of a page, with the positions of lines found in one pass.
+
+    The first position of each line, the positions of the empty lines
+    (blanks), the first positions of the lines containing each of MARKERS
+    (markers) and the positions of the lines that may contain a DOI
+    (doi_lines) are found when first needed, so that index() and find()
+    take constant time; index() has the semantics of list.index. Changing
+    the list drops the positions, which are then found again when needed.
+    Copies share them until they are changed.
+    """
+
+    def __init__(self, lines=(), positions=None):
+        list.__init__(self, lines)
+        self._positions = positions
+
+    def positions(self):
+        """
+        Return the first positions of the lines, the blanks, the markers
+        and the DOI lines.
+        """
+        if self._positions is None:
+            first = {}
+            blanks = []
+            markers = {}
+            doi_lines = []
+            for position, line in enumerate(self):
+                first.setdefault(line, position)
+                if line == '':
+                    blanks.append(position)
+                for marker in MARKERS:
+                    if marker in line:
+                        markers.setdefault(marker, position)
+                if doi_candidate(line):
+                    doi_lines.append(position)
+            self._positions = (first, blanks, markers, doi_lines)
+        return self._positions
+
+    @property
+    def blanks(self):
+        return self.positions()[1]
+
+    @property
+    def markers(self):
+        return self.positions()[2]
+
+    @property
+    def doi_lines(self):
+        return self.positions()[3]
+
+    def copy(self):
+        return PageLines(self, self.positions())
+
+    def index(self, line, *bounds):
+        if bounds:
+            return list.index(self, line, *bounds)
+        try:
+            return self.positions()[0][line]
+        except KeyError:
+            raise ValueError(repr(line) + ' is not in list') from None
+
+    def __contains__(self, line):
+        return line in self.positions()[0]
+
+    def find(self, string):
+        """
+        Return the position of the first line containing string. Raises
+        IndexError if there is none.
+        """
+        if string in MARKERS:
+            if string not in self.markers:
+                raise IndexError(repr(string) + ' is not on the page')
+            return self.markers[string]
+        return first_index(self, lambda line: string in line)
+
+
+def _dropping_positions(method):
+    def changed(self, *args, **kwargs):
+        self._positions = None
+        return method(self, *args, **kwargs)
+    changed.__name__ = method.__name__
+    return changed
+
+
+for name in ('__setitem__', '__delitem__', '__iadd__', '__imul__', 'append',
+             'extend', 'insert', 'pop', 'remove', 'clear', 'sort',
+             'reverse'):
+    setattr(PageLines, name, _dropping_positions(getattr(list, name)))
+
+
+class PageText:
+    """
+    Text of the pages of a PDF, split into lines.
+
+    Layout analysis is expensive, so each page is laid out at most once,
+    however often its lines are requested while detecting the journal and
+    parsing the metadata. Parsers that only need the head of a page can
+    ask for it with head() or lines_before(); then only the top fraction
+    head_fraction of the page is laid out, unless the whole page already
+    is. Layout is timed as a stage in timings (see Timings), if given.
+    The file is read through the MappedFile mapped, if given.
+    """
+
+    def __init__(self, filename, head_fraction=None, timings=None,
+                 mapped=None):
+        self.filename = filename
+        self.head_fraction = head_fraction
+        self.timings = timings or Timings()
+        self.mapped = mapped
+        self._pages = {}
+        self._heads = {}
+
+    def _open(self):
+        if self.mapped is not None:
+            return self.mapped.view()
+        return open(self.filename, 'rb')
+
+    def _layout(self, page_number, top=None):
+        rsrcmgr = PDFResourceManager()
+        device = RegionAggregator(rsrcmgr, laparams=LAParams(), top=top)
+        interpreter = PDFPageInterpreter(rsrcmgr, device)
+        with self.timings.stage('layout'), self._open() as f:
+            for page in PDFPage.get_pages(f, [page_number],
+                                          maxpages=page_number+1):
+                interpreter.process_page(page)
+                return device.get_result()
+        raise PDFRenameError("There is no page " + str(page_number+1) +
+                             ".")
+
+    def lines(self, page_number=0):
+        """
+        Return the lines of page page_number (counting from 0).
+
+        Each call returns a new PageLines, so callers can modify it (e.g.
+        with tag_empty_items) without affecting later callers; the positions
+        of the lines are only found once per page.
+        """
+        if page_number not in self._pages:
+            self._pages[page_number] = \
+                PageLines(render_lines(self._layout(page_number)))
+        return self._pages[page_number].copy()
+
+    def iter_lines(self, page_number=0, top=None):
+        """
+        Yield the lines of the top fraction top of page page_number.
+
+        With top None (or 1 or more), the lines of the whole page are
+        yielded. Lines are produced lazily, so callers can stop as soon
+        as they have found what they are looking for.
+        """
+        if page_number in self._pages:
+            yield from self._pages[page_number]
+        elif top is None or top >= 1:
+            yield from self.lines(page_number)
+        else:
+            if (page_number, top) not in self._heads:
+                self._heads[page_number, top] = \
+                    self._layout(page_number, top)
+            yield from render_lines(self._heads[page_number, top])
+
+    def text(self, page_number=0):
+        """
+        Return the text of page page_number as far as it has been laid out
+        (the whole page, or its head), or None if it has not been.
+        """
+        if page_number in self._pages:
+            lines = self._pages[page_number]
+        else:
+            heads = [ltpage for (number, _), ltpage in self._heads.items()
+                     if number == page_number]
+            if not heads:
+                return None
+            lines = list(render_lines(heads[-1]))
+        return '\n'.join(lines).rstrip('\f')
+
+    def head(self, n, page_number=0):
+        """
+        Return the first n lines of page page_number.
+
+        If the top of the page has fewer than n lines, the whole page is
+        laid out.
+        """
+        head = []
+        for line in self.iter_lines(page_number, self.head_fraction):
+            if line.endswith('\f'):
+                break
+            head.append(line)
+            if len(head) == n:
+                return head
+        return self.lines(page_number)[:n]
+
+    def lines_before(self, marker, page_number=0):
+        """
+        Return the lines of page page_number before the first one
+        containing marker.
+
+        If marker is not found in the top of the page, the whole page is
+        laid out. Raises IndexError if marker is not on the page at all.
+        """
+        head = []
+        for line in self.iter_lines(page_number, self.head_fraction):
+            if marker in line:
+                return head
+            head.append(line)
+        text = self.lines(page_number)
+        return text[:text.find(marker)]
+
+
+def get_doi_from_text(text, notes=None):
+    """
+    Extract DOI from text (a list of sentences, or PageLines).
+
+    If there is none, a note saying so is added to the list notes, if
+    given (see Record.notes).
+    """
+    try:
+        if isinstance(text, PageLines):
+            position = text.doi_lines[0]
+        else:
+            position = first_index(text, doi_candidate)
+        doi = re.search('(10.+?)( |$|,)', text[position]).group(1)
+    except IndexError or AttributeError:
+        doi = ""
+    if doi == "" and notes is not None:
+        notes.append("Couldn't get DOI.")
+    return doi
+
+
+def first_index(list, predicate):
+    """
+    Return the index of the first item in list for which predicate is
+    true. Raises IndexError if there is none.
+    """
+    for i, s in enumerate(list):
+        if predicate(s):
+            return i
+    raise IndexError('no matching item in list')
+
+
+def get_index(string, list):
+    """
+    Return index of the first item in list containing string.
+    """
+    if isinstance(list, PageLines):
+        return list.find(string)
+    return first_index(list, lambda s: string in s)
+
+
+def tag_empty_items(list):
+    """
+    Replace empty strings in list by strings of integers starting with 1.
+
+    Replaces empty string items in the input list by strings of subsequent
+    integers starting with '1'. This allows addressing items before and
+    after what are originally empty strings easily using the index method
+    and specifying the integer.
+    """
+    if isinstance(list, PageLines):
+        blanks = list.blanks
+    else:
+        blanks = [position for position, item in enumerate(list)
+                  if item == '']
+    for i, position in enumerate(blanks, 1):
+        list[position] = str(i)
+    return(list)
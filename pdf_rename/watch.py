@@ -0,0 +1,262 @@
+"""Watching directories for new PDFs."""
+import ctypes
+import ctypes.util
+import os
+import queue
+import select
+import struct
+import threading
+import time
+
+from .files import find_pdfs, matches
+
+# Seconds a file must stay unchanged before it is handled.
+SETTLE_TIME = 1.0
+
+
+QUEUE_SIZE = 256
+
+
+POLL_INTERVAL = 2.0  # seconds, without inotify
+
+
+# From <sys/inotify.h>.
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+EVENT = struct.Struct('iIII')
+
+
+def signature(path):
+    """Return the size, modification time and inode of path, or None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_size, st.st_mtime_ns, st.st_ino
+
+
+class InotifyWatcher:
+    """
+    Report files that are written or moved into directories, via inotify.
+
+    Files are reported when they are created (including as hard links),
+    closed after writing, or moved in. Raises OSError if inotify is not
+    available.
+    """
+
+    def __init__(self, paths, patterns, recursive=True):
+        name = ctypes.util.find_library('c')
+        self.libc = ctypes.CDLL(name, use_errno=True)
+        if not hasattr(self.libc, 'inotify_init1'):
+            raise OSError('inotify is not available')
+        self.fd = self.libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self.paths = paths
+        self.patterns = patterns
+        self.recursive = recursive
+        self.started = time.time()
+        self.directories = {}
+        for path in paths:
+            self.add(path)
+
+    def add(self, directory):
+        """Watch directory (and, if recursive, its subdirectories)."""
+        mask = IN_CLOSE_WRITE | IN_MOVED_TO | IN_CREATE
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(directory),
+                                         mask)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), directory)
+        self.directories[wd] = directory
+        if self.recursive:
+            for entry in os.scandir(directory):
+                if entry.is_dir(follow_symlinks=False):
+                    self.add(entry.path)
+
+    def recent(self):
+        """
+        Return the files changed since watching started, for when events
+        were lost because the kernel's event queue overflowed.
+        """
+        return [path for path in find_pdfs(self.paths, self.patterns,
+                                           self.recursive)
+                if os.path.getctime(path) >= self.started]
+
+    def read(self, timeout=None):
+        """
+        Wait up to timeout seconds (None: indefinitely) for events.
+
+        Returns the paths of the files concerned.
+        """
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        try:
+            data = os.read(self.fd, 1 << 16)
+        except BlockingIOError:
+            return []
+        paths = []
+        offset = 0
+        while offset < len(data):
+            wd, mask, cookie, length = EVENT.unpack_from(data, offset)
+            name = data[offset + EVENT.size:offset + EVENT.size + length]
+            offset = offset + EVENT.size + length
+            if mask & IN_Q_OVERFLOW:
+                paths.extend(self.recent())
+                continue
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+                continue
+            directory = self.directories.get(wd)
+            if directory is None:
+                continue
+            path = os.path.join(directory, os.fsdecode(name.rstrip(b'\0')))
+            if mask & IN_ISDIR:
+                if self.recursive:
+                    try:
+                        self.add(path)
+                    except OSError:
+                        continue
+                    paths.extend(find_pdfs([path], self.patterns))
+            elif matches(os.path.basename(path), self.patterns):
+                paths.append(path)
+        return paths
+
+
+class PollingWatcher:
+    """
+    Report files that are written or moved into directories, by scanning
+    them every interval seconds.
+    """
+
+    def __init__(self, paths, patterns, recursive=True,
+                 interval=POLL_INTERVAL):
+        self.paths = paths
+        self.patterns = patterns
+        self.recursive = recursive
+        self.interval = interval
+        self.files = self.scan()
+        self.next_scan = time.monotonic() + interval
+
+    def scan(self):
+        files = {}
+        for path in find_pdfs(self.paths, self.patterns, self.recursive):
+            files[path] = signature(path)
+        return files
+
+    def read(self, timeout=None):
+        """
+        Wait up to timeout seconds (None: until the next scan) for new or
+        changed files, and return their paths.
+        """
+        wait = max(0, self.next_scan - time.monotonic())
+        if timeout is not None and timeout < wait:
+            time.sleep(timeout)
+            return []
+        time.sleep(wait)
+        self.next_scan = time.monotonic() + self.interval
+        files = self.scan()
+        changed = [path for path, known in files.items()
+                   if self.files.get(path) != known]
+        self.files = files
+        return changed
+
+
+class WorkQueue:
+    """
+    Bounded queue of paths, each of which is held at most once.
+
+    put() blocks while the queue is full. An exception put with fail() is
+    raised by get() once the paths before it have been taken.
+    """
+
+    def __init__(self, size=QUEUE_SIZE):
+        self.queue = queue.Queue(size)
+        self.queued = set()
+        self.lock = threading.Lock()
+
+    def put(self, path):
+        with self.lock:
+            if path in self.queued:
+                return
+            self.queued.add(path)
+        self.queue.put(path)
+
+    def fail(self, error):
+        self.queue.put(error)
+
+    def get(self):
+        path = self.queue.get()
+        if isinstance(path, BaseException):
+            raise path
+        with self.lock:
+            self.queued.discard(path)
+        return path
+
+
+def collect(watcher, work, settle, ignore):
+    """
+    Put the files reported by watcher into work once they are complete.
+
+    A file is complete once it has not changed for settle seconds; events
+    for the same file until then are coalesced. Files whose signature is
+    the one recorded in ignore (i.e. files written by the script) are
+    skipped. If watching fails, the exception is put into work (see
+    WorkQueue.fail), so that it is raised where the files are handled.
+    """
+    pending = {}
+    try:
+        while True:
+            timeout = settle / 2 if pending else None
+            paths = watcher.read(timeout)
+            now = time.monotonic()
+            for path in paths:
+                pending[path] = now, None
+            for path, (since, known) in list(pending.items()):
+                current = signature(path)
+                if current is None:
+                    del pending[path]
+                elif current != known:
+                    pending[path] = now, current
+                elif now - since >= settle:
+                    del pending[path]
+                    if ignore.pop(path, None) != current:
+                        work.put(path)
+    except Exception as error:
+        work.fail(error)
+
+
+def watch(paths, handle, patterns, recursive=True, settle=SETTLE_TIME,
+          queue_size=QUEUE_SIZE):
+    """
+    Call handle(path) for each file matching patterns that is written or
+    moved into one of the directories paths, until interrupted.
+
+    Files are handled one at a time in the calling thread, in the order
+    they were completed. handle returns the path of a file it created
+    (e.g. a renamed copy) or None; the events for that file are ignored.
+    Uses inotify if available and polls the directories otherwise.
+    Exceptions raised while watching are raised here.
+    """
+    try:
+        watcher = InotifyWatcher(paths, patterns, recursive)
+    except OSError:
+        watcher = PollingWatcher(paths, patterns, recursive)
+    work = WorkQueue(queue_size)
+    ignore = {}
+    collector = threading.Thread(target=collect,
+                                 args=(watcher, work, settle, ignore),
+                                 daemon=True)
+    collector.start()
+    while True:
+        path = work.get()
+        if not os.path.exists(path):
+            continue
+        target = handle(path)
+        if target is not None:
+            ignore[target] = signature(target)
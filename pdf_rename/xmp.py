@@ -0,0 +1,113 @@
+"""Reading the XMP metadata of a PDF (the /Metadata stream of its catalog)."""
+import re
+import xml.etree.ElementTree as ElementTree
+
+from pdfminer.pdftypes import PDFException, resolve1, stream_value
+from pdfminer.psparser import PSException
+
+RDF = '{http://www.w3.org/1999/02/22-rdf-syntax-ns#}'
+
+# Namespaces of the properties that are read, by prefix. PRISM has had
+# several versions (basic/1.2/, 2.0/, 3.0/, ...), which are all accepted.
+NAMESPACES = {'http://purl.org/dc/elements/1.1/': 'dc',
+              'http://ns.adobe.com/pdf/1.3/': 'pdf'}
+PRISM = 'http://prismstandard.org/namespaces/'
+
+
+def prefixed(tag):
+    """Return '{uri}name' as 'prefix:name', or None for other namespaces."""
+    uri, _, name = tag[1:].partition('}')
+    if uri.startswith(PRISM):
+        return 'prism:' + name
+    if uri in NAMESPACES:
+        return NAMESPACES[uri] + ':' + name
+    return None
+
+
+def values(element):
+    """Return the values of a property: the items of a list, or its text."""
+    items = element.findall(RDF + 'Seq/' + RDF + 'li') + \
+        element.findall(RDF + 'Bag/' + RDF + 'li') + \
+        element.findall(RDF + 'Alt/' + RDF + 'li')
+    if items:
+        return [' '.join((item.text or '').split()) for item in items]
+    return [' '.join((element.text or '').split())]
+
+
+def parse_xmp(data):
+    """
+    Return the dc, prism and pdf properties in the XMP packet data.
+
+    The properties map 'prefix:name' (e.g. 'dc:creator', 'prism:doi') to
+    lists of strings; properties may be given as elements or as attributes
+    of rdf:Description. Returns {} if data is not well-formed.
+    """
+    try:
+        root = ElementTree.fromstring(data)
+    except ElementTree.ParseError:
+        return {}
+    properties = {}
+    for description in root.iter(RDF + 'Description'):
+        for tag, value in description.attrib.items():
+            name = prefixed(tag)
+            if name and value.strip():
+                properties.setdefault(name, [' '.join(value.split())])
+        for element in description:
+            name = prefixed(element.tag)
+            if name:
+                found = [value for value in values(element) if value]
+                if found:
+                    properties.setdefault(name, found)
+    return properties
+
+
+def read_xmp(doc):
+    """Return the properties (see parse_xmp) of the PDFDocument doc."""
+    try:
+        metadata = resolve1(doc.catalog.get('Metadata'))
+        if metadata is None:
+            return {}
+        data = stream_value(metadata).get_data()
+    except (PDFException, PSException, TypeError, ValueError):
+        return {}
+    return parse_xmp(data.strip(b'\0 \t\r\n'))
+
+
+def xmp_fields(properties, journal):
+    """
+    Return the record fields in properties (see parse_xmp) for journal,
+    a (key, journaltitle, shortjournaltitle) tuple, or None if the title,
+    authors, year, volume, first page or DOI are missing.
+
+    Papers numbered by article (e.g. in Cognition) have the article number
+    as prism:articleNumber, or as a starting page without an ending page;
+    like the journal parsers, their eid is the article number and their
+    pages start at 1.
+    """
+    def first(name):
+        return properties.get(name, [''])[0]
+
+    key, journaltitle, shortjournaltitle = journal
+    title = first('dc:title')
+    authors = properties.get('dc:creator', [])
+    date = (first('prism:coverDate') or first('prism:publicationDate') or
+            first('prism:coverDisplayDate'))
+    year = re.search(r'\d{4}', date)
+    volume = first('prism:volume')
+    page_start = first('prism:startingPage')
+    page_end = first('prism:endingPage')
+    number = first('prism:number')
+    doi = re.sub(r'^(https?://(dx\.)?doi\.org/|doi:\s*)', '',
+                 first('prism:doi') or first('dc:identifier'))
+    if not (title and authors and year and volume and page_start and
+            doi.startswith('10.')):
+        return None
+    eid = first('prism:articleNumber')
+    if not page_end:
+        eid = eid or page_start
+        page_start = "1"
+    return {'authors': authors, 'year': year.group(0), 'title': title,
+            'journaltitle': journaltitle,
+            'shortjournaltitle': shortjournaltitle, 'volume': volume,
+            'number': number, 'page_start': page_start,
+            'page_end': page_end, 'doi': doi, 'eid': eid}
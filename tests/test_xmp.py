@@ -0,0 +1,67 @@
+"""Tests of the records read from XMP metadata."""
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                '..'))
+
+from pdf_rename.journals import registry, xmp_journals  # noqa: E402
+from pdf_rename.parse import clean_record  # noqa: E402
+from pdf_rename.record import Record  # noqa: E402
+from pdf_rename.text import PageLines  # noqa: E402
+from pdf_rename.xmp import xmp_fields  # noqa: E402
+
+
+class Page:
+    """A PageText with the given lines of the first page."""
+
+    def __init__(self, lines):
+        self._lines = lines
+
+    def lines(self):
+        return PageLines(self._lines)
+
+
+class CognitionTest(unittest.TestCase):
+    """Cognition papers are numbered by article."""
+
+    info = {'Subject': b'Cognition, 190 (2019) 104012. '
+                       b'doi:10.1016/j.cognition.2019.104012'}
+    lines = ['Cognition 190 (2019) 104012', '',
+             'Contents lists available at ScienceDirect', '',
+             'Cognition', '',
+             'journal homepage: www.elsevier.com/locate/cognit', '',
+             'The title of a Cognition paper', 'Jane Doe1*, ', '',
+             'John Smith2', '', 'Abstract', '',
+             'https://doi.org/10.1016/j.cognition.2019.104012']
+    properties = {'dc:title': ['The title of a Cognition paper'],
+                  'dc:creator': ['Jane Doe', 'John Smith'],
+                  'prism:publicationName': ['Cognition'],
+                  'prism:coverDate': ['2019-09-01'],
+                  'prism:volume': ['190'],
+                  'prism:startingPage': ['104012'],
+                  'prism:doi': ['10.1016/j.cognition.2019.104012']}
+
+    def parser_record(self):
+        fields = registry.function('cognition')(
+            self.info, 'Cognition', None, Page(self.lines), '', None)
+        return clean_record(Record(**fields))
+
+    def xmp_record(self, properties):
+        fields = xmp_fields(properties, xmp_journals['cognition'])
+        return clean_record(Record(**fields))
+
+    def test_starting_page(self):
+        self.assertEqual(self.xmp_record(self.properties),
+                         self.parser_record())
+
+    def test_article_number(self):
+        properties = dict(self.properties,
+                          **{'prism:articleNumber': ['104012'],
+                             'prism:startingPage': ['1']})
+        self.assertEqual(self.xmp_record(properties), self.parser_record())
+
+
+if __name__ == '__main__':
+    unittest.main()